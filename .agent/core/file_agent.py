@@ -197,22 +197,26 @@ class CoworkFileAgent:
         files = organizer.scan_folder()
         operations = organizer.batch_rename(files, pattern)
         
+        result = {
+            'success': True,
+            'dry_run': dry_run,
+            'files_renamed': len(operations),
+            'operations': operations
+        }
+        
         if dry_run:
             organizer.preview_operations()
         else:
             organizer.execute_operations()
+            # Closes the undo journal execute_operations appended to
+            result['backup_path'] = str(organizer.save_backup())
             self.permission_manager.log_operation(
                 operation='batch_rename',
                 path=str(folder_path),
                 success=True
             )
         
-        return {
-            'success': True,
-            'dry_run': dry_run,
-            'files_renamed': len(operations),
-            'operations': operations
-        }
+        return result
 
 
 def main():
@@ -0,0 +1,40 @@
+"""
+JSON I/O helpers for Personal AI OS
+
+Uses orjson when it is installed and falls back to the stdlib encoder
+with matching output, so callers never need to check for it.
+
+Usage:
+    from core.jsonio import loads, dumps_bytes, dumps_pretty
+
+    data = loads(path.read_bytes())
+    path.write_text(dumps_pretty(data), encoding='utf-8')
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Compact UTF-8 encoded JSON, e.g. for request bodies."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps_pretty(obj) -> str:
+    """JSON indented by 2 spaces, for files people read."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -6,13 +6,30 @@ used by Session Wrapper and other skills for task management.
 """
 
 import os
+import sys
 import json
+import time
+import asyncio
+import hashlib
+import tempfile
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 from dataclasses import dataclass
 
+if TYPE_CHECKING:  # aiohttp is optional and imported where it is used
+    import aiohttp
+
+try:
+    from .jsonio import dumps_bytes as _json_dumps, loads as _json_loads
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from jsonio import dumps_bytes as _json_dumps, loads as _json_loads
+
 # Load .env from workspace root
 try:
     from dotenv import load_dotenv
@@ -27,6 +44,77 @@ except ImportError:
     pass  # dotenv not installed, rely on system env vars
 
 
+# Read-query responses, shared across CLI runs
+CACHE_FILE = Path.home() / ".cache" / "personal-ai-os" / "linear_responses.json"
+# Entries older than the longest TTL are dropped on write
+CACHE_MAX_AGE_SECONDS = 24 * 3600
+
+
+class _ResponseCache:
+    """Small JSON file cache of GraphQL `data` payloads with per-lookup TTLs."""
+    
+    def __init__(self, path: Path = CACHE_FILE):
+        self.path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        # Threaded lookups share one cache; entries and file writes go under it
+        self._lock = threading.Lock()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                entries = _json_loads(self.path.read_bytes())
+            except (OSError, ValueError):
+                entries = {}
+            self._entries = entries if isinstance(entries, dict) else {}
+        return self._entries
+    
+    def get(self, key: str, ttl: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and time.time() - entry.get("ts", 0) < ttl:
+            return entry.get("data")
+        return None
+    
+    def set(self, key: str, data: Dict[str, Any]):
+        self.set_many({key: data})
+    
+    def set_many(self, items: Dict[str, Dict[str, Any]]):
+        """Store several responses with a single file write."""
+        if not items:
+            return
+        with self._lock:
+            now = time.time()
+            entries = {k: v for k, v in self._load().items() if now - v.get("ts", 0) < CACHE_MAX_AGE_SECONDS}
+            for key, data in items.items():
+                entries[key] = {"ts": now, "data": data}
+            self._entries = entries
+            self._write(entries)
+    
+    def _write(self, entries: Dict[str, Dict[str, Any]]):
+        # Write a sibling temp file and swap it in, so readers in other
+        # processes never see a truncated cache
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_json_dumps(entries))
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass  # Cache is best-effort
+    
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+
 @dataclass
 class LinearIssue:
     identifier: str
@@ -44,13 +132,66 @@ class LinearClient:
     
     API_URL = "https://api.linear.app/graphql"
     
-    def __init__(self, api_key: Optional[str] = None, config_path: Optional[Path] = None):
+    # Response cache TTLs (seconds) for read queries
+    IN_PROGRESS_TTL = 60
+    COMPLETED_TTL = 300
+    ISSUE_TTL = 24 * 3600
+    
+    # Issue selections shared by every issue query. List queries use the lean
+    # shape; description (often several KB) is only fetched when asked for.
+    ISSUE_LIST_FIELDS = """
+    fragment IssueFields on Issue {
+        identifier
+        title
+        url
+        state { name }
+        project { name }
+        cycle { number }
+        labels { nodes { name } }
+    }
+    """
+    
+    ISSUE_FULL_FIELDS = """
+    fragment IssueFields on Issue {
+        identifier
+        title
+        url
+        description
+        state { name }
+        project { name }
+        cycle { number }
+        labels { nodes { name } }
+    }
+    """
+    
+    # In-progress and recently completed issues as two aliased selections,
+    # so a session costs one round trip instead of two
+    SESSION_TICKETS_QUERY = """
+    query SessionTickets($since: DateTime!) {
+        inProgress: issues(filter: { state: { name: { eq: "In Progress" } } }) {
+            nodes { ...IssueFields }
+        }
+        recent: issues(filter: { completedAt: { gt: $since } }) {
+            nodes { ...IssueFields }
+        }
+    }
+    """
+    
+    GET_ISSUE_QUERY = """
+    query GetIssue($id: String!) {
+        issue(id: $id) { ...IssueFields }
+    }
+    """ + ISSUE_FULL_FIELDS
+    
+    def __init__(self, api_key: Optional[str] = None, config_path: Optional[Path] = None,
+                 use_cache: bool = True):
         """
         Initialize the Linear client.
         
         Args:
             api_key: Direct API key (takes precedence)
             config_path: Path to mcp_config.json (legacy fallback)
+            use_cache: Serve repeated read queries from CACHE_FILE within their TTL
         
         Priority order:
         1. api_key parameter
@@ -58,6 +199,9 @@ class LinearClient:
         3. mcp_config.json (legacy, deprecated)
         """
         self.api_key = api_key
+        # Pooled session, created on first request
+        self._http_session = None
+        self._cache = _ResponseCache() if use_cache else None
         
         # Try environment variable first
         if not self.api_key:
@@ -73,6 +217,32 @@ class LinearClient:
             if default_config.exists():
                 self.api_key = self._load_api_key(default_config)
     
+    @property
+    def _session(self) -> requests.Session:
+        # One keep-alive session for all queries so the TLS connection to
+        # Linear is reused; auth headers are installed once here
+        if self._http_session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            session.headers.update({
+                "Content-Type": "application/json",
+                "Authorization": self.api_key
+            })
+            self._http_session = session
+        return self._http_session
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+    
+    def __enter__(self) -> "LinearClient":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
     def _load_api_key(self, config_path: Path) -> Optional[str]:
         """Load API key from config file (legacy, deprecated)."""
         try:
@@ -83,17 +253,44 @@ class LinearClient:
             return None
 
     
+    def _cache_key(self, query: str, variables: Optional[Dict]) -> str:
+        """Hash of the API key, query and variables (keys sorted)."""
+        raw = json.dumps([self.api_key, query, variables], sort_keys=True)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _since(hours: int, resolution: int) -> str:
+        """ISO cutoff `hours` ago, floored to `resolution` seconds so it stays cacheable."""
+        now = datetime.fromtimestamp(time.time() // resolution * resolution)
+        return (now - timedelta(hours=hours)).isoformat()
+    
     def _execute_query(self, query: str, variables: Optional[Dict] = None, 
-                       max_retries: int = 3) -> Dict[str, Any]:
-        """Execute a GraphQL query against Linear API with retry logic."""
+                       max_retries: int = 3, cache_ttl: float = 0) -> Dict[str, Any]:
+        """Execute a GraphQL query against Linear API with retry logic.
+        
+        Read queries may pass cache_ttl to reuse a cached response that is
+        younger than that many seconds; mutations clear the cache.
+        """
         if not self.api_key:
             raise ValueError("No Linear API key configured")
         
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": self.api_key
-        }
+        cache_key = None
+        if self._cache is not None and cache_ttl > 0:
+            cache_key = self._cache_key(query, variables)
+            cached = self._cache.get(cache_key, cache_ttl)
+            if cached is not None:
+                return cached
+        
+        data = self._post_query(query, variables, max_retries)
         
+        if cache_key is not None:
+            self._cache.set(cache_key, data)
+        elif self._cache is not None and query.lstrip().startswith("mutation"):
+            self._cache.clear()
+        return data
+    
+    def _post_query(self, query: str, variables: Optional[Dict], max_retries: int) -> Dict[str, Any]:
+        """POST one GraphQL request, retrying rate limits, 5xx and connection errors."""
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
@@ -101,35 +298,34 @@ class LinearClient:
         last_exception = None
         for attempt in range(max_retries):
             try:
-                response = requests.post(self.API_URL, headers=headers, json=payload, timeout=30)
+                # Content-Type is already set on the session
+                response = self._session.post(self.API_URL, data=_json_dumps(payload), timeout=(3.05, 30))
                 
                 if response.status_code == 429:  # Rate limited
                     wait_time = min(2 ** attempt, 8)  # 1, 2, 4, max 8 seconds
-                    import time
                     time.sleep(wait_time)
                     continue
                 
                 if response.status_code >= 500:  # Server error, retry
                     wait_time = min(2 ** attempt, 8)
-                    import time
                     time.sleep(wait_time)
                     continue
                 
                 if response.status_code != 200:
                     raise Exception(f"Linear API error: {response.status_code} - {response.text}")
                 
-                data = response.json()
+                data = _json_loads(response.content)
                 
                 if "errors" in data:
                     raise Exception(f"GraphQL errors: {data['errors']}")
                 
                 return data.get("data", {})
                 
-            except requests.exceptions.RequestException as e:
+            # ValueError: undecodable body, retried like response.json() errors were
+            except (requests.exceptions.RequestException, ValueError) as e:
                 last_exception = e
                 if attempt < max_retries - 1:
                     wait_time = min(2 ** attempt, 8)
-                    import time
                     time.sleep(wait_time)
                     continue
                 raise Exception(f"Linear API request failed after {max_retries} retries: {e}")
@@ -138,56 +334,51 @@ class LinearClient:
             raise Exception(f"Linear API request failed after {max_retries} retries: {last_exception}")
         raise Exception("Linear API request failed unexpectedly")
     
-    def get_in_progress_issues(self) -> List[LinearIssue]:
+    @classmethod
+    def _issue_fields(cls, include_description: bool) -> str:
+        return cls.ISSUE_FULL_FIELDS if include_description else cls.ISSUE_LIST_FIELDS
+    
+    def get_in_progress_issues(self, include_description: bool = False) -> List[LinearIssue]:
         """Get all issues currently in progress."""
         query = """
         query InProgressIssues {
             issues(filter: { state: { name: { eq: "In Progress" } } }) {
-                nodes {
-                    identifier
-                    title
-                    url
-                    description
-                    state { name }
-                    project { name }
-                    cycle { number }
-                    labels { nodes { name } }
-                }
+                nodes { ...IssueFields }
             }
         }
         """
         
-        data = self._execute_query(query)
+        data = self._execute_query(query + self._issue_fields(include_description),
+                                   cache_ttl=self.IN_PROGRESS_TTL)
         return self._parse_issues(data.get("issues", {}).get("nodes", []))
     
-    def get_recently_completed(self, hours: int = 24) -> List[LinearIssue]:
+    def get_recently_completed(self, hours: int = 24,
+                               include_description: bool = False) -> List[LinearIssue]:
         """Get issues completed within the specified hours."""
-        since = (datetime.now() - timedelta(hours=hours)).isoformat()
+        since = self._since(hours, self.COMPLETED_TTL)
         
         query = """
         query RecentlyCompleted($since: DateTime!) {
             issues(filter: { completedAt: { gt: $since } }) {
-                nodes {
-                    identifier
-                    title
-                    url
-                    description
-                    state { name }
-                    project { name }
-                    cycle { number }
-                    labels { nodes { name } }
-                }
+                nodes { ...IssueFields }
             }
         }
         """
         
-        data = self._execute_query(query, {"since": since})
+        data = self._execute_query(query + self._issue_fields(include_description),
+                                   {"since": since}, cache_ttl=self.COMPLETED_TTL)
         return self._parse_issues(data.get("issues", {}).get("nodes", []))
     
-    def get_session_tickets(self, hours: int = 24) -> List[LinearIssue]:
+    def get_session_tickets(self, hours: int = 24,
+                            include_description: bool = False) -> List[LinearIssue]:
         """Get all tickets relevant to a session (in progress + recently done)."""
-        in_progress = self.get_in_progress_issues()
-        completed = self.get_recently_completed(hours)
+        since = self._since(hours, self.IN_PROGRESS_TTL)
+        
+        query = self.SESSION_TICKETS_QUERY + self._issue_fields(include_description)
+        data = self._execute_query(query, {"since": since},
+                                   cache_ttl=self.IN_PROGRESS_TTL)
+        in_progress = self._parse_issues(data.get("inProgress", {}).get("nodes", []))
+        completed = self._parse_issues(data.get("recent", {}).get("nodes", []))
         
         # Deduplicate by identifier
         seen = set()
@@ -201,23 +392,9 @@ class LinearClient:
     
     def get_issue_by_id(self, identifier: str) -> Optional[LinearIssue]:
         """Get a specific issue by its identifier (e.g., 'DEZ-123')."""
-        query = """
-        query GetIssue($id: String!) {
-            issue(id: $id) {
-                identifier
-                title
-                url
-                description
-                state { name }
-                project { name }
-                cycle { number }
-                labels { nodes { name } }
-            }
-        }
-        """
-        
         try:
-            data = self._execute_query(query, {"id": identifier})
+            data = self._execute_query(self.GET_ISSUE_QUERY, {"id": identifier},
+                                       cache_ttl=self.ISSUE_TTL)
             issue_data = data.get("issue")
             if issue_data:
                 return self._parse_issue(issue_data)
@@ -225,26 +402,110 @@ class LinearClient:
             pass
         return None
     
-    def search_issues(self, query_text: str) -> List[LinearIssue]:
+    async def _aexecute_query(self, session: "aiohttp.ClientSession", query: str,
+                              variables: Optional[Dict] = None,
+                              max_retries: int = 3) -> Dict[str, Any]:
+        """Async counterpart of _execute_query on a shared aiohttp session."""
+        import aiohttp
+        
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        
+        last_exception = None
+        for attempt in range(max_retries):
+            try:
+                async with session.post(self.API_URL, data=_json_dumps(payload)) as response:
+                    if response.status == 429 or response.status >= 500:  # Rate limited / server error
+                        await asyncio.sleep(min(2 ** attempt, 8))
+                        continue
+                    
+                    if response.status != 200:
+                        raise Exception(f"Linear API error: {response.status} - {await response.text()}")
+                    
+                    data = _json_loads(await response.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                last_exception = e
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(min(2 ** attempt, 8))
+                    continue
+                raise Exception(f"Linear API request failed after {max_retries} retries: {e}")
+            
+            if "errors" in data:
+                raise Exception(f"GraphQL errors: {data['errors']}")
+            
+            return data.get("data", {})
+        
+        if last_exception:
+            raise Exception(f"Linear API request failed after {max_retries} retries: {last_exception}")
+        raise Exception("Linear API request failed unexpectedly")
+    
+    async def aget_issues_by_id(self, identifiers: List[str],
+                                concurrency: int = 8) -> List[Optional[LinearIssue]]:
+        """Look up several issues concurrently; results follow input order."""
+        import aiohttp
+        
+        if not self.api_key:
+            raise ValueError("No Linear API key configured")
+        
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+        timeout = aiohttp.ClientTimeout(total=30, connect=3.05)
+        headers = {"Content-Type": "application/json", "Authorization": self.api_key}
+        
+        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
+            # Fresh responses are cached in one write after gather, rather
+            # than a blocking file write per issue inside the event loop
+            fetched: Dict[str, Dict[str, Any]] = {}
+            
+            async def fetch(identifier: str) -> Optional[LinearIssue]:
+                variables = {"id": identifier}
+                cache_key = self._cache_key(self.GET_ISSUE_QUERY, variables)
+                data = self._cache.get(cache_key, self.ISSUE_TTL) if self._cache is not None else None
+                if data is None:
+                    try:
+                        data = await self._aexecute_query(session, self.GET_ISSUE_QUERY, variables)
+                    except Exception:
+                        return None
+                    fetched[cache_key] = data
+                issue_data = data.get("issue")
+                return self._parse_issue(issue_data) if issue_data else None
+            
+            results = await asyncio.gather(*(fetch(identifier) for identifier in identifiers))
+        
+        if self._cache is not None:
+            self._cache.set_many(fetched)
+        return results
+    
+    def get_issues_by_id(self, identifiers: List[str], concurrency: int = 8) -> List[Optional[LinearIssue]]:
+        """Look up several issues, overlapping the per-request latency."""
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            pass  # Optional; fall back to the pooled session
+        else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:  # No loop running, so asyncio.run is safe
+                return asyncio.run(self.aget_issues_by_id(identifiers, concurrency))
+            # Called from within an event loop (e.g. an MCP server); asyncio.run
+            # would raise there, so use threads. Async callers can await
+            # aget_issues_by_id directly instead.
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self.get_issue_by_id, identifiers))
+    
+    def search_issues(self, query_text: str, include_description: bool = False) -> List[LinearIssue]:
         """Search for issues by text."""
         query = """
         query SearchIssues($query: String!) {
             issueSearch(query: $query, first: 10) {
-                nodes {
-                    identifier
-                    title
-                    url
-                    description
-                    state { name }
-                    project { name }
-                    cycle { number }
-                    labels { nodes { name } }
-                }
+                nodes { ...IssueFields }
             }
         }
         """
         
-        data = self._execute_query(query, {"query": query_text})
+        data = self._execute_query(query + self._issue_fields(include_description),
+                                   {"query": query_text})
         return self._parse_issues(data.get("issueSearch", {}).get("nodes", []))
     
     def _parse_issues(self, nodes: List[Dict]) -> List[LinearIssue]:
@@ -470,26 +731,18 @@ class LinearClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
-    def list_all_issues(self, limit: int = 50) -> List[LinearIssue]:
+    def list_all_issues(self, limit: int = 50, include_description: bool = False) -> List[LinearIssue]:
         """Get all issues in the workspace."""
         query = """
         query AllIssues($first: Int!) {
             issues(first: $first, orderBy: createdAt) {
-                nodes {
-                    identifier
-                    title
-                    url
-                    description
-                    state { name }
-                    project { name }
-                    cycle { number }
-                    labels { nodes { name } }
-                }
+                nodes { ...IssueFields }
             }
         }
         """
         
-        data = self._execute_query(query, {"first": limit})
+        data = self._execute_query(query + self._issue_fields(include_description),
+                                   {"first": limit})
         return self._parse_issues(data.get("issues", {}).get("nodes", []))
     
     def update_state(self, issue_id: str, state_name: str) -> Dict[str, Any]:
@@ -626,12 +879,11 @@ def format_issues_for_display(issues: List[LinearIssue]) -> str:
 
 # CLI interface
 if __name__ == "__main__":
-    import sys
-    
-    client = LinearClient()
+    args = [arg for arg in sys.argv[1:] if arg != "--no-cache"]
+    client = LinearClient(use_cache="--no-cache" not in sys.argv)
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
+    if args:
+        command = args[0]
         
         if command == "--test":
             result = client.test_connection()
@@ -659,8 +911,12 @@ if __name__ == "__main__":
                 "project": i.project
             } for i in issues], indent=2))
         
-        elif command == "--search" and len(sys.argv) > 2:
-            query_text = " ".join(sys.argv[2:])
+        elif command == "--issues" and len(args) > 1:
+            issues = client.get_issues_by_id(args[1:])
+            print(format_issues_for_display([i for i in issues if i]))
+        
+        elif command == "--search" and len(args) > 1:
+            query_text = " ".join(args[1:])
             issues = client.search_issues(query_text)
             print(format_issues_for_display(issues))
         
@@ -669,7 +925,9 @@ if __name__ == "__main__":
             print("  python linear_client.py --test         # Test connection")
             print("  python linear_client.py --in-progress  # Get in-progress issues")
             print("  python linear_client.py --session      # Get session-relevant issues")
+            print("  python linear_client.py --issues <id>...  # Look up issues concurrently")
             print("  python linear_client.py --search <query>  # Search issues")
+            print("  Add --no-cache to bypass the response cache")
     else:
         # Default: show session tickets
         issues = client.get_session_tickets()
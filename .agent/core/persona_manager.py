@@ -4,10 +4,18 @@ Persona Manager - Manage specialized agent personas
 Handles loading, switching, and filtering skills based on active persona
 """
 
+import os
+import sys
 import json
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from .jsonio import dumps_bytes, dumps_pretty, loads as _json_loads
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from jsonio import dumps_bytes, dumps_pretty, loads as _json_loads
+
 
 class PersonaManager:
     """Manage agent personas and skill restrictions"""
@@ -16,9 +24,12 @@ class PersonaManager:
         self.personas_dir = Path(personas_dir)
         self.config_dir = Path(config_dir)
         self.active_persona_file = self.config_dir / 'active_persona.json'
+        self.persona_cache_file = self.config_dir / 'personas_cache.json'
         
         self.personas = {}
         self.active_persona = None
+        # Allowed skill ids of the active persona (None = all skills allowed)
+        self._allowed_set = None
         
         self.load_all_personas()
         self.load_active_persona()
@@ -29,11 +40,29 @@ class PersonaManager:
             print(f"⚠️  Personas directory not found: {self.personas_dir}")
             return
         
+        # Parsed personas keyed by path; only changed files are re-parsed
+        cache = self._load_persona_cache()
+        new_cache = {}
+        dirty = False
+        
         persona_count = 0
-        for persona_file in self.personas_dir.glob('*.json'):
+        with os.scandir(self.personas_dir) as entries:
+            persona_entries = [e for e in entries if e.name.endswith('.json') and e.is_file()]
+        
+        for entry in persona_entries:
+            persona_file = Path(entry.path)
             try:
-                with open(persona_file, 'r', encoding='utf-8') as f:
-                    persona_data = json.load(f)
+                key = entry.path
+                st = entry.stat()
+                signature = [st.st_mtime_ns, st.st_size]
+                cached = cache.get(key)
+                if cached and cached[0] == signature:
+                    persona_data = cached[1]
+                else:
+                    with open(persona_file, 'r', encoding='utf-8') as f:
+                        persona_data = _json_loads(f.read())
+                    dirty = True
+                new_cache[key] = [signature, persona_data]
                 
                 persona_id = persona_data.get('id')
                 if persona_id:
@@ -43,18 +72,39 @@ class PersonaManager:
             except Exception as e:
                 print(f"✗ Error loading {persona_file.name}: {e}")
         
+        if dirty or new_cache.keys() != cache.keys():
+            self._save_persona_cache(new_cache)
+        
         print(f"\n📋 Total personas loaded: {persona_count}")
     
+    def _load_persona_cache(self):
+        """Load the parsed-persona cache ({path: [[mtime_ns, size], data]})"""
+        try:
+            with open(self.persona_cache_file, 'r', encoding='utf-8') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _save_persona_cache(self, cache):
+        """Persist the parsed-persona cache (best effort)"""
+        try:
+            self.config_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.persona_cache_file, 'w', encoding='utf-8') as f:
+                f.write(dumps_pretty(cache))
+        except OSError as e:
+            print(f"⚠️  Could not write persona cache: {e}")
+    
     def load_active_persona(self):
         """Load the currently active persona from config"""
         if self.active_persona_file.exists():
             try:
                 with open(self.active_persona_file, 'r', encoding='utf-8') as f:
-                    active_data = json.load(f)
+                    active_data = _json_loads(f.read())
                 
                 persona_id = active_data.get('persona_id')
                 if persona_id and persona_id in self.personas:
-                    self.active_persona = self.personas[persona_id]
+                    self._set_active_persona(self.personas[persona_id])
                     print(f"✓ Active persona: {self.active_persona['name']}")
                 else:
                     print("⚠️  No valid active persona found")
@@ -63,14 +113,26 @@ class PersonaManager:
         else:
             print("ℹ️  No active persona set (using default mode - all skills available)")
     
-    def activate_persona(self, persona_id):
-        """Switch to a specific persona"""
+    def _set_active_persona(self, persona):
+        """Set the active persona and rebuild its allowed-skill lookup"""
+        self.active_persona = persona
+        if persona is None:
+            self._allowed_set = None
+        else:
+            self._allowed_set = frozenset(persona.get('allowed_skills', []))
+    
+    def activate_persona(self, persona_id, pretty=False):
+        """Switch to a specific persona
+        
+        active_persona.json is machine-read, so it is written compactly
+        unless pretty=True.
+        """
         if persona_id not in self.personas:
             print(f"✗ Persona not found: {persona_id}")
             print(f"Available personas: {', '.join(self.personas.keys())}")
             return False
         
-        self.active_persona = self.personas[persona_id]
+        self._set_active_persona(self.personas[persona_id])
         
         # Save to config
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -81,7 +143,8 @@ class PersonaManager:
         }
         
         with open(self.active_persona_file, 'w', encoding='utf-8') as f:
-            json.dump(active_data, f, indent=2)
+            f.write(dumps_pretty(active_data) if pretty
+                    else dumps_bytes(active_data).decode('utf-8'))
         
         print(f"\n🎭 Switched to: {self.active_persona['name']}")
         print(f"📝 Description: {self.active_persona['description']}")
@@ -93,7 +156,7 @@ class PersonaManager:
     
     def deactivate_persona(self):
         """Return to default mode (all skills available)"""
-        self.active_persona = None
+        self._set_active_persona(None)
         
         if self.active_persona_file.exists():
             self.active_persona_file.unlink()
@@ -134,21 +197,24 @@ class PersonaManager:
     
     def list_personas(self):
         """List all available personas"""
-        print("\n📋 Available Personas:\n")
+        lines = ["\n📋 Available Personas:\n"]
         
         for persona_id, persona in self.personas.items():
             status = "🎭 ACTIVE" if (self.active_persona and self.active_persona['id'] == persona_id) else "  "
-            print(f"{status} {persona['name']} ({persona_id})")
-            print(f"      {persona['description']}")
-            print(f"      Skills: {', '.join(persona.get('allowed_skills', []))}")
-            print()
+            lines.append(f"{status} {persona['name']} ({persona_id})")
+            lines.append(f"      {persona['description']}")
+            lines.append(f"      Skills: {', '.join(persona.get('allowed_skills', []))}")
+            lines.append("")
+        
+        # One write instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def filter_skills(self, all_skills):
         """Filter skills based on active persona's allowed list"""
-        if not self.active_persona:
+        allowed = self._allowed_set
+        if allowed is None:
             return all_skills  # No filtering in default mode
         
-        allowed = set(self.active_persona.get('allowed_skills', []))
         filtered = [s for s in all_skills if s.get('id') in allowed]
         
         print(f"🔍 Filtered to {len(filtered)}/{len(all_skills)} skills for {self.active_persona['name']}")
@@ -165,6 +231,7 @@ def main():
     parser.add_argument("--activate", "-a", help="Activate a persona by ID")
     parser.add_argument("--deactivate", "-d", action="store_true", help="Deactivate current persona")
     parser.add_argument("--status", "-s", action="store_true", help="Show current persona status")
+    parser.add_argument("--pretty", action="store_true", help="Write active_persona.json indented for humans")
     
     args = parser.parse_args()
     
@@ -173,7 +240,7 @@ def main():
     if args.list:
         pm.list_personas()
     elif args.activate:
-        pm.activate_persona(args.activate)
+        pm.activate_persona(args.activate, pretty=args.pretty)
     elif args.deactivate:
         pm.deactivate_persona()
     elif args.status:
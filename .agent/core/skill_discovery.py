@@ -4,11 +4,73 @@ Skill Discovery and Management Helper
 Scans .agent/skills/ and registers available skills
 """
 
-import json
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import yaml
 
+try:
+    from .jsonio import dumps_pretty, loads as _json_loads
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from jsonio import dumps_pretty, loads as _json_loads
+
+# libyaml's C loader is much faster than the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Frontmatter: '---' line, then everything up to the next line starting '---'
+_FRONTMATTER_RE = re.compile(r'---[^\n]*\n(.*?)^---', re.S | re.M)
+# Large enough for every SKILL.md frontmatter in the repo (largest ~1.8 KB)
+_FRONTMATTER_HEAD_CHARS = 4096
+
+def _read_frontmatter(skill_md):
+    """Read only the YAML frontmatter block of a SKILL.md (None if absent)"""
+    with open(skill_md, 'r', encoding='utf-8') as f:
+        head = f.read(_FRONTMATTER_HEAD_CHARS)
+        match = _FRONTMATTER_RE.match(head)
+        if match is None and head.startswith('---') and len(head) == _FRONTMATTER_HEAD_CHARS:
+            # Frontmatter longer than the head chunk (rare): read the rest
+            match = _FRONTMATTER_RE.match(head + f.read())
+    return match.group(1) if match else None
+
+def _parse_skill(skill_folder):
+    """Parse one skill folder; returns (skill_info or None, log line or None)"""
+    skill_md = skill_folder / 'SKILL.md'
+    if not skill_md.exists():
+        return None, None
+    
+    # Parse SKILL.md frontmatter
+    try:
+        # Extract YAML frontmatter without reading the body
+        raw_frontmatter = _read_frontmatter(skill_md)
+        if raw_frontmatter is None:
+            return None, None
+        frontmatter = yaml.load(raw_frontmatter, Loader=_YamlLoader)
+        skill_info = {
+            'id': skill_folder.name,
+            'name': frontmatter.get('name', skill_folder.name),
+            'description': frontmatter.get('description', ''),
+            'version': frontmatter.get('version', '1.0.0'),
+            'path': str(skill_folder),
+            'triggers': frontmatter.get('triggers', []),
+            'examples': frontmatter.get('examples', []),
+            'context_hints': frontmatter.get('context_hints', []),
+            'priority': frontmatter.get('priority', 5),
+            'conflicts_with': frontmatter.get('conflicts_with', []),
+            'capabilities': frontmatter.get('capabilities', []),
+            'dependencies': frontmatter.get('dependencies', []),
+            'enabled': True,
+            'auto_load': frontmatter.get('auto_load', True)
+        }
+        return skill_info, f"✓ Discovered skill: {skill_info['name']}"
+    except Exception as e:
+        return None, f"✗ Error parsing {skill_folder.name}: {e}"
+
 def discover_skills(skills_dir='.agent/skills'):
     """Scan skills directory and build registry"""
     skills = []
@@ -18,46 +80,23 @@ def discover_skills(skills_dir='.agent/skills'):
         print(f"Skills directory not found: {skills_dir}")
         return skills
     
-    for skill_folder in skills_path.iterdir():
-        if not skill_folder.is_dir():
-            continue
-            
-        skill_md = skill_folder / 'SKILL.md'
-        if not skill_md.exists():
-            continue
-        
-        # Parse SKILL.md frontmatter
-        try:
-            with open(skill_md, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Extract YAML frontmatter
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    frontmatter = yaml.safe_load(parts[1])
-                    
-                    skill_info = {
-                        'id': skill_folder.name,
-                        'name': frontmatter.get('name', skill_folder.name),
-                        'description': frontmatter.get('description', ''),
-                        'version': frontmatter.get('version', '1.0.0'),
-                        'path': str(skill_folder),
-                        'triggers': frontmatter.get('triggers', []),
-                        'examples': frontmatter.get('examples', []),
-                        'context_hints': frontmatter.get('context_hints', []),
-                        'priority': frontmatter.get('priority', 5),
-                        'conflicts_with': frontmatter.get('conflicts_with', []),
-                        'capabilities': frontmatter.get('capabilities', []),
-                        'dependencies': frontmatter.get('dependencies', []),
-                        'enabled': True,
-                        'auto_load': frontmatter.get('auto_load', True)
-                    }
-                    
-                    skills.append(skill_info)
-                    print(f"✓ Discovered skill: {skill_info['name']}")
-        except Exception as e:
-            print(f"✗ Error parsing {skill_folder.name}: {e}")
+    # DirEntry carries the file type, so no extra stat per entry
+    with os.scandir(skills_path) as entries:
+        skill_folders = [Path(e.path) for e in entries if e.is_dir()]
+    
+    # Skill files are independent, so read and parse them concurrently;
+    # results come back in folder order and are printed from this thread
+    messages = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for skill_info, message in executor.map(_parse_skill, skill_folders):
+            if skill_info is not None:
+                skills.append(skill_info)
+            if message:
+                messages.append(message)
+    
+    # One write instead of a print per skill
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
     
     return skills
 
@@ -65,16 +104,22 @@ def update_registry(skills):
     """Update skill_registry.json with discovered skills"""
     registry_path = Path('.agent/config/skill_registry.json')
     
-    if registry_path.exists():
-        with open(registry_path, 'r', encoding='utf-8') as f:
-            registry = json.load(f)
-    else:
+    # One read serves both the metadata merge and the unchanged check
+    try:
+        old_text = registry_path.read_text(encoding='utf-8')
+        registry = _json_loads(old_text)
+    except FileNotFoundError:
+        old_text = None
         registry = {'version': '1.0', 'skills': []}
     
     registry['skills'] = skills
+    new_text = dumps_pretty(registry)
+    
+    if new_text == old_text:
+        print(f"\n✓ Registry unchanged: {len(skills)} skills registered")
+        return
     
-    with open(registry_path, 'w', encoding='utf-8') as f:
-        json.dump(registry, f, indent=2)
+    registry_path.write_text(new_text, encoding='utf-8')
     
     print(f"\n✓ Registry updated: {len(skills)} skills registered")
 
@@ -1,4 +1,7 @@
 import os
+import json
+import time
+import hashlib
 import datetime
 import feedparser
 import requests
@@ -15,7 +18,9 @@ CONFIG = {
         {"name": "Reddit r/ArtificialIntelligence", "url": "https://www.reddit.com/r/ArtificialInteligence/.rss"},
         {"name": "Reddit r/LocalLLaMA", "url": "https://www.reddit.com/r/LocalLLaMA/.rss"}
     ],
-    "output_dir": "vault/Areas/AI/Reports"
+    "output_dir": "vault/Areas/AI/Reports",
+    "trends_timeframe": "now 7-d",
+    "trends_cache_ttl_seconds": 3600
 }
 
 # Categorization Keywords
@@ -39,14 +44,51 @@ def categorize_item(title, summary):
     
     return "🌐 General"
 
+def _trends_cache_key():
+    """Cache key that changes when the keyword list or timeframe changes."""
+    raw = json.dumps([sorted(CONFIG["trends_keywords"]), CONFIG["trends_timeframe"]])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _trends_cache_path():
+    return os.path.join(os.getcwd(), CONFIG["output_dir"], ".trends_cache.json")
+
+def _load_cached_trends():
+    """Returns cached trends if still within TTL and for the same keywords."""
+    cache_path = _trends_cache_path()
+    try:
+        if time.time() - os.path.getmtime(cache_path) >= CONFIG["trends_cache_ttl_seconds"]:
+            return None
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cached.get("key") != _trends_cache_key():
+        return None
+    return cached.get("data")
+
+def _save_cached_trends(trends_data):
+    cache_path = _trends_cache_path()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"key": _trends_cache_key(), "data": trends_data}, f)
+    except OSError as e:
+        print(f"⚠️ Could not write trends cache: {e}")
+
 def get_google_trends():
     """Fetches trending related queries for configured keywords."""
+    cached = _load_cached_trends()
+    if cached is not None:
+        print("📈 Using cached Google Trends")
+        return cached
+    
     print("📈 Fetching Google Trends...")
     trends_data = {}
     try:
         pytrends = TrendReq(hl='en-US', tz=360)
         # Using a broader timeframe or related queries
-        pytrends.build_payload(CONFIG["trends_keywords"], cat=0, timeframe='now 7-d', geo='', gprop='')
+        pytrends.build_payload(CONFIG["trends_keywords"], cat=0, timeframe=CONFIG["trends_timeframe"], geo='', gprop='')
         related_queries = pytrends.related_queries()
         
         for keyword, data in related_queries.items():
@@ -58,7 +100,10 @@ def get_google_trends():
     except Exception as e:
         print(f"⚠️ Error fetching Google Trends: {e}")
         trends_data["Error"] = [str(e)]
-        
+        return trends_data
+    
+    # Only successful fetches are cached
+    _save_cached_trends(trends_data)
     return trends_data
 
 def get_rss_feed(source):
@@ -152,18 +197,17 @@ def generate_markdown(trends_data, all_news_items):
 def main():
     print("🚀 Starting AI Researcher (Categorized)...")
     
-    # 1. Fetch Trends
-    trends_data = get_google_trends()
-    
-    # 2. Fetch RSS Feeds
+    # 1. Fetch Trends and RSS Feeds concurrently (they are independent)
     all_news_items = []
-    with ThreadPoolExecutor(max_workers=5) as executor:
+    with ThreadPoolExecutor(max_workers=len(CONFIG["rss_feeds"]) + 1) as executor:
+        trends_future = executor.submit(get_google_trends)
         future_to_source = {executor.submit(get_rss_feed, source): source for source in CONFIG["rss_feeds"]}
         for future in as_completed(future_to_source):
             items = future.result()
             all_news_items.extend(items)
+        trends_data = trends_future.result()
             
-    # 3. Generate Report
+    # 2. Generate Report
     generate_markdown(trends_data, all_news_items)
     print("✨ Research complete!")
 
@@ -14,6 +14,8 @@ import sys
 import json
 import shutil
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Tuple
@@ -40,6 +42,11 @@ class ArtifactSync:
         'other': 'Plans',
     }
     
+    # Precompiled patterns for topic extraction
+    _H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+    _NON_WORD_RE = re.compile(r'[^\w\s-]')
+    _WS_RE = re.compile(r'\s+')
+    
     def __init__(self, vault_path: str = None, dry_run: bool = False):
         """Initialize with vault path"""
         if vault_path is None:
@@ -51,6 +58,8 @@ class ArtifactSync:
         
         self.vault_path = vault_path
         self.dry_run = dry_run
+        # Keeps multi-line output from parallel syncs together
+        self._print_lock = threading.Lock()
         
         # Ensure target folders exist
         for folder in set(self.TARGET_FOLDERS.values()):
@@ -69,34 +78,63 @@ class ArtifactSync:
         
         return 'other'
     
+    def _slugify_heading(self, heading: str) -> str:
+        """Turn an H1 heading into a short topic slug"""
+        # Clean up the topic
+        topic = self._NON_WORD_RE.sub('', heading)
+        topic = topic.lower().strip()
+        # Convert to slug
+        topic = self._WS_RE.sub('_', topic)
+        # Limit length
+        words = topic.split('_')[:4]
+        return '_'.join(words)
+    
+    def _slugify_line(self, line: str) -> str:
+        """Turn a plain content line into a topic slug"""
+        first_line = self._NON_WORD_RE.sub('', line[:50])
+        return self._WS_RE.sub('_', first_line.lower().strip())
+    
     def extract_topic(self, content: str) -> str:
         """Extract topic from artifact content"""
         # Try to get H1 heading
-        h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        h1_match = self._H1_RE.search(content)
         if h1_match:
-            topic = h1_match.group(1)
-            # Clean up the topic
-            topic = re.sub(r'[^\w\s-]', '', topic)
-            topic = topic.lower().strip()
-            # Convert to slug
-            topic = re.sub(r'\s+', '_', topic)
-            # Limit length
-            words = topic.split('_')[:4]
-            return '_'.join(words)
+            return self._slugify_heading(h1_match.group(1))
         
         # Fallback: use first meaningful line
         lines = [l.strip() for l in content.split('\n') if l.strip() and not l.startswith('---')]
         if lines:
-            first_line = lines[0][:50]
-            first_line = re.sub(r'[^\w\s-]', '', first_line)
-            return re.sub(r'\s+', '_', first_line.lower().strip())
+            return self._slugify_line(lines[0])
         
         return 'untitled'
     
-    def generate_filename(self, source_path: Path, content: str) -> Tuple[str, str]:
+    def _peek_topic(self, source_path: Path, max_lines: int = 200) -> str:
+        """Extract topic by scanning only the head of the artifact.
+        
+        Stops at the first H1 heading instead of reading the whole file.
+        """
+        first_line = None
+        with source_path.open('r', encoding='utf-8') as f:
+            for i, line in enumerate(f):
+                if i >= max_lines:
+                    break
+                h1_match = self._H1_RE.match(line)
+                if h1_match:
+                    return self._slugify_heading(h1_match.group(1))
+                if first_line is None and line.strip() and not line.startswith('---'):
+                    first_line = line.strip()
+        
+        if first_line:
+            return self._slugify_line(first_line)
+        
+        return 'untitled'
+    
+    def generate_filename(self, source_path: Path, content: Optional[str],
+                          topic: Optional[str] = None) -> Tuple[str, str]:
         """Generate intuitive filename from artifact"""
         artifact_type = self.detect_type(source_path)
-        topic = self.extract_topic(content)
+        if topic is None:
+            topic = self.extract_topic(content)
         date = datetime.now().strftime('%Y-%m-%d')
         
         # Map type to suffix
@@ -116,70 +154,74 @@ class ArtifactSync:
         """Add or update frontmatter with sync metadata"""
         now = datetime.now().isoformat()
         
-        new_frontmatter = f"""---
-type: {artifact_type}
-source: {source_path}
-synced: {now}
-topic: {topic.replace('_', ' ')}
----
-
-"""
-        
         # Check if content already has frontmatter
         if content.startswith('---'):
-            # Find end of frontmatter
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
+            # Find end of frontmatter without splitting the whole body
+            end = content.find('---', 3)
+            if end != -1:
                 # Keep original frontmatter and add sync info
-                original_fm = parts[1].strip()
-                rest = parts[2]
+                original_fm = content[3:end].strip()
                 
                 # Add sync metadata to existing frontmatter
-                updated_fm = f"""---
+                return f"""---
 {original_fm}
 sync_source: {source_path}
 sync_time: {now}
 ---
-"""
-                return updated_fm + rest
+{content[end + 3:]}"""
         
         # No existing frontmatter, add new
-        return new_frontmatter + content
+        return f"""---
+type: {artifact_type}
+source: {source_path}
+synced: {now}
+topic: {topic.replace('_', ' ')}
+---
+
+{content}"""
     
-    def sync_artifact(self, source_path: Path) -> Optional[Path]:
-        """Sync a single artifact to Obsidian"""
-        if not source_path.exists():
-            print(f"❌ Source not found: {source_path}")
-            return None
-        
-        # Read content
-        content = source_path.read_text(encoding='utf-8')
+    def resolve_target(self, source_path: Path) -> Tuple[Path, str, str]:
+        """Work out where an artifact syncs to: (target path, type, topic)"""
+        # Topic only needs the head of the file
+        topic = self._peek_topic(source_path)
         
         # Generate filename and detect type
-        filename, artifact_type = self.generate_filename(source_path, content)
-        topic = self.extract_topic(content)
+        filename, artifact_type = self.generate_filename(source_path, None, topic=topic)
         
         # Determine target folder
         target_folder = self.TARGET_FOLDERS.get(artifact_type, 'Plans')
-        target_path = self.vault_path / target_folder / filename
+        return self.vault_path / target_folder / filename, artifact_type, topic
+    
+    def sync_artifact(self, source_path: Path,
+                      resolved: Optional[Tuple[Path, str, str]] = None) -> Optional[Path]:
+        """Sync a single artifact to Obsidian"""
+        if not source_path.exists():
+            with self._print_lock:
+                print(f"❌ Source not found: {source_path}")
+            return None
         
-        # Add frontmatter
-        synced_content = self.add_frontmatter(content, source_path, topic, artifact_type)
+        target_path, artifact_type, topic = resolved or self.resolve_target(source_path)
         
         if self.dry_run:
-            print(f"[DRY RUN] Would sync:")
-            print(f"  Source: {source_path}")
-            print(f"  Target: {target_path}")
-            print(f"  Type: {artifact_type}")
-            print(f"  Topic: {topic}")
+            with self._print_lock:
+                print(f"[DRY RUN] Would sync:")
+                print(f"  Source: {source_path}")
+                print(f"  Target: {target_path}")
+                print(f"  Type: {artifact_type}")
+                print(f"  Topic: {topic}")
             return target_path
         
+        # Read full content and add frontmatter
+        content = source_path.read_text(encoding='utf-8')
+        synced_content = self.add_frontmatter(content, source_path, topic, artifact_type)
+        
         # Write to target
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_text(synced_content, encoding='utf-8')
         
-        print(f"✅ Synced: {source_path.name}")
-        print(f"   → {target_path}")
+        with self._print_lock:
+            print(f"✅ Synced: {source_path.name}")
+            print(f"   → {target_path}")
         
         return target_path
     
@@ -193,26 +235,43 @@ sync_time: {now}
             print(f"❌ Brain directory not found: {brain_dir}")
             return []
         
-        results = []
         cutoff = datetime.now().timestamp() - (hours * 3600)
         
         # Find artifact files
         artifact_patterns = ['implementation_plan.md', 'task.md', 'walkthrough.md']
+        candidates = []
         
-        for conv_dir in brain_dir.iterdir():
-            if not conv_dir.is_dir():
-                continue
+        with os.scandir(brain_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                
+                for pattern in artifact_patterns:
+                    artifact = Path(entry.path) / pattern
+                    # A single stat both checks existence and recency
+                    try:
+                        mtime = artifact.stat().st_mtime
+                    except FileNotFoundError:
+                        continue
+                    if mtime > cutoff:
+                        candidates.append(artifact)
+        
+        if not candidates:
+            return []
+        
+        # Artifacts are independent, so sync them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            # Artifacts sharing date, topic and type map to one target; sync
+            # each such group in order within a single task so writes never
+            # overlap and the last candidate still wins
+            groups = {}
+            for source, resolved in zip(candidates, executor.map(self.resolve_target, candidates)):
+                groups.setdefault(resolved[0], []).append((source, resolved))
+            
+            def sync_group(group):
+                return [self.sync_artifact(source, resolved) for source, resolved in group]
             
-            for pattern in artifact_patterns:
-                artifact = conv_dir / pattern
-                if artifact.exists():
-                    # Check if recent
-                    if artifact.stat().st_mtime > cutoff:
-                        result = self.sync_artifact(artifact)
-                        if result:
-                            results.append(result)
-        
-        return results
+            return [r for results in executor.map(sync_group, groups.values()) for r in results if r]
 
 
 def main():
@@ -10,12 +10,19 @@ Usage via Claude:
     firecrawl_scrape(url="https://example.com", formats=["branding"])
 """
 
+import sys
 import json
-from dataclasses import dataclass
+from datetime import datetime
+from dataclasses import dataclass, fields
+from itertools import chain
 from typing import Optional
 
+# slots=True drops the per-instance __dict__ (Python 3.10+; plain
+# dataclasses on older interpreters)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Colors:
     """Brand color palette"""
     primary: Optional[str] = None
@@ -26,7 +33,7 @@ class Colors:
     text_secondary: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Typography:
     """Brand typography system"""
     font_families: dict = None  # primary, heading, code
@@ -34,14 +41,14 @@ class Typography:
     font_weights: dict = None   # regular, medium, bold
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Spacing:
     """Brand spacing guidelines"""
     base_unit: Optional[int] = None    # e.g., 8
     border_radius: Optional[str] = None # e.g., "8px"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BrandingProfile:
     """Complete brand identity profile"""
     url: str
@@ -53,63 +60,73 @@ class BrandingProfile:
     favicon_url: Optional[str] = None
 
 
+def _camel(name: str) -> str:
+    """Convert a dataclass field name to the Firecrawl camelCase key"""
+    head, *tail = name.split('_')
+    return head + ''.join(part.title() for part in tail)
+
+
+# Firecrawl keys for the fixed-shape sections, derived once at import
+_COLOR_FIELDS = tuple(_camel(f.name) for f in fields(Colors))
+_SPACING_FIELDS = tuple(
+    (_camel(f.name), f.name.replace('_', ' ').title()) for f in fields(Spacing)
+)
+_SPACING_UNITS = {'baseUnit': 'px'}
+
+
+_KV_CODE = "- {k}: `{v}`"
+_KV_PLAIN = "- {k}: {v}"
+_IMAGE_FIELDS = (('logo', 'Logo'), ('favicon', 'Favicon'))
+
+
+def _render_kv(items, fmt: str) -> str:
+    """Render (key, value) pairs as Markdown bullets, skipping empty values"""
+    return "\n".join(fmt.format(k=k, v=v) for k, v in items if v)
+
+
+def _section(title: str, body: str) -> str:
+    """Render a Markdown section, omitting the body line when empty"""
+    return f"## {title}\n{body}" if body else f"## {title}"
+
+
 def format_brand_markdown(branding: dict, url: str) -> str:
     """Format branding data as Markdown report"""
-    
-    lines = [
-        f"# Brand Analysis: {url}",
-        "",
-        "## Color Scheme",
-        f"- Mode: {branding.get('colorScheme', 'unknown')}",
-        "",
-        "## Colors"
-    ]
-    
     colors = branding.get('colors', {})
-    for key, value in colors.items():
-        if value:
-            lines.append(f"- {key}: `{value}`")
-    
-    lines.extend([
-        "",
-        "## Typography"
-    ])
-    
-    typography = branding.get('typography', {})
-    font_families = typography.get('fontFamilies', {})
-    for key, value in font_families.items():
-        if value:
-            lines.append(f"- {key}: {value}")
-    
-    lines.extend([
-        "",
-        "## Spacing"
-    ])
-    
     spacing = branding.get('spacing', {})
-    if spacing.get('baseUnit'):
-        lines.append(f"- Base Unit: {spacing['baseUnit']}px")
-    if spacing.get('borderRadius'):
-        lines.append(f"- Border Radius: {spacing['borderRadius']}")
-    
     images = branding.get('images', {})
+    
+    # Known palette keys first, in palette order, then any extra keys
+    # Firecrawl returned (e.g. link, error)
+    color_items = chain(
+        ((key, colors.get(key)) for key in _COLOR_FIELDS),
+        ((key, value) for key, value in colors.items() if key not in _COLOR_FIELDS),
+    )
+    spacing_items = (
+        (label, f"{value}{_SPACING_UNITS.get(key, '')}")
+        for key, label in _SPACING_FIELDS if (value := spacing.get(key))
+    )
+    
+    sections = [
+        ("Colors", color_items, _KV_CODE),
+        ("Typography", branding.get('typography', {}).get('fontFamilies', {}).items(), _KV_PLAIN),
+        ("Spacing", spacing_items, _KV_PLAIN),
+    ]
     if images:
-        lines.extend([
-            "",
-            "## Images"
-        ])
-        if images.get('logo'):
-            lines.append(f"- Logo: {images['logo']}")
-        if images.get('favicon'):
-            lines.append(f"- Favicon: {images['favicon']}")
+        sections.append(
+            ("Images", ((label, images.get(key)) for key, label in _IMAGE_FIELDS), _KV_PLAIN)
+        )
+    body = "\n\n".join(_section(title, _render_kv(items, fmt)) for title, items, fmt in sections)
     
-    return "\n".join(lines)
+    return f"""# Brand Analysis: {url}
+
+## Color Scheme
+- Mode: {branding.get('colorScheme', 'unknown')}
+
+{body}"""
 
 
 def format_brand_json(branding: dict, url: str) -> str:
     """Format branding data as JSON"""
-    from datetime import datetime
-    
     output = {
         "url": url,
         "extracted_at": datetime.now().isoformat(),
@@ -6,12 +6,38 @@ or weekly summaries.
 """
 
 import json
-import requests
+import functools
+import itertools
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, List, Tuple
 from dataclasses import dataclass
 
+if TYPE_CHECKING:  # requests is imported lazily at runtime (see get_session)
+    import requests
+
+# Shared helpers live in .agent/core; appended so core modules never
+# shadow the caller's own (config, logger, ...)
+sys.path.append(str(Path(__file__).parent.parent.parent.parent / 'core'))
+
+from jsonio import dumps_bytes, loads as _json_loads
+
+
+# requests.RequestException derives from OSError; catching the base keeps
+# requests out of module import (see get_session)
+_REQUEST_ERRORS = (OSError,)
+# ...plus ValueError for undecodable JSON response bodies
+_RESPONSE_ERRORS = (OSError, ValueError)
+
+
+def _retry_after_seconds(value: Optional[str], default: float = 1.0) -> float:
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return default  # Missing or HTTP-date form
+
 
 @dataclass
 class DevToArticle:
@@ -21,6 +47,10 @@ class DevToArticle:
     published: bool = False
     series: Optional[str] = None
     canonical_url: Optional[str] = None
+    
+    def __post_init__(self):
+        # Dev.to allows max 4 tags
+        self.tags = self.tags[:4]
 
 
 @dataclass
@@ -29,6 +59,17 @@ class PublishResult:
     article_id: Optional[int]
     url: Optional[str]
     error: Optional[str]
+    rate_limit_remaining: Optional[str] = None
+    
+    @classmethod
+    def failed(cls, error: str, rate_limit_remaining: Optional[str] = None) -> "PublishResult":
+        return cls(
+            success=False,
+            article_id=None,
+            url=None,
+            error=error,
+            rate_limit_remaining=rate_limit_remaining
+        )
 
 
 class DevToClient:
@@ -36,24 +77,89 @@ class DevToClient:
     
     BASE_URL = "https://dev.to/api"
     
+    # Transport-level retries for rate limits and transient server errors;
+    # Retry-After is honoured. Articles are created as drafts by default,
+    # so a retried POST cannot publish a duplicate by surprise.
+    MAX_RETRIES = 5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    BACKOFF_FACTOR = 0.5
+    
+    # Parsed API keys shared across instances, keyed by (config path, mtime_ns)
+    _API_KEY_CACHE: Dict[Tuple[str, int], Optional[str]] = {}
+    
     def __init__(self, api_key: Optional[str] = None, config_path: Optional[Path] = None):
         self.api_key = api_key
+        # HTTP stack is imported and the session created on first request
+        self._http_session = None
         
         if not self.api_key and config_path:
             self.api_key = self._load_api_key(config_path)
         
         if not self.api_key:
-            default_config = Path(".agent/config/mcp_config.json")
-            if default_config.exists():
-                self.api_key = self._load_api_key(default_config)
+            self.api_key = self._load_api_key(Path(".agent/config/mcp_config.json"))
+    
+    @classmethod
+    def get_session(cls) -> "requests.Session":
+        """Create a keep-alive session with a connection pool for dev.to."""
+        # Imported here: requests/urllib3 dominate CLI startup time
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry = Retry(
+            total=cls.MAX_RETRIES,
+            backoff_factor=cls.BACKOFF_FACTOR,
+            status_forcelist=cls.RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=retry
+        ))
+        return session
+    
+    @property
+    def _session(self) -> "requests.Session":
+        # One pooled session for all calls so dev.to connections are reused;
+        # auth headers are installed once here rather than per request
+        if self._http_session is None:
+            self._http_session = self.get_session()
+            self._http_session.headers.update(self._headers())
+        return self._http_session
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+    
+    def __enter__(self) -> "DevToClient":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
     
     def _load_api_key(self, config_path: Path) -> Optional[str]:
+        config_path = Path(config_path)
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            return config.get("devto", {}).get("api_key")
+            key = (str(config_path), config_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            return None
+        if key in self._API_KEY_CACHE:
+            return self._API_KEY_CACHE[key]
+        
+        try:
+            config = _json_loads(config_path.read_bytes())
+            api_key = config.get("devto", {}).get("api_key")
         except (json.JSONDecodeError, FileNotFoundError):
             return None
+        
+        self._API_KEY_CACHE[key] = api_key
+        return api_key
     
     def _headers(self) -> Dict[str, str]:
         return {
@@ -67,7 +173,7 @@ class DevToClient:
             return {"success": False, "error": "No API key configured"}
         
         try:
-            response = requests.get(f"{self.BASE_URL}/users/me", headers=self._headers())
+            response = self._session.get(f"{self.BASE_URL}/users/me")
             if response.status_code == 200:
                 user = response.json()
                 return {
@@ -78,24 +184,16 @@ class DevToClient:
                 }
             else:
                 return {"success": False, "error": f"API error: {response.status_code}"}
-        except Exception as e:
+        except _RESPONSE_ERRORS as e:
             return {"success": False, "error": str(e)}
     
-    def create_article(self, article: DevToArticle) -> PublishResult:
-        """Create a new article on Dev.to."""
-        if not self.api_key:
-            return PublishResult(
-                success=False,
-                article_id=None,
-                url=None,
-                error="No API key configured"
-            )
-        
+    @staticmethod
+    def _article_payload(article: DevToArticle) -> bytes:
         payload = {
             "article": {
                 "title": article.title,
                 "body_markdown": article.body_markdown,
-                "tags": article.tags[:4],  # Dev.to allows max 4 tags
+                "tags": article.tags,
                 "published": article.published
             }
         }
@@ -105,35 +203,107 @@ class DevToClient:
         if article.canonical_url:
             payload["article"]["canonical_url"] = article.canonical_url
         
+        return dumps_bytes(payload)
+    
+    def create_article(self, article: DevToArticle) -> PublishResult:
+        """Create a new article on Dev.to."""
+        if not self.api_key:
+            return PublishResult.failed("No API key configured")
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.BASE_URL}/articles",
-                headers=self._headers(),
-                json=payload
+                data=self._article_payload(article)
             )
-            
-            if response.status_code == 201:
-                data = response.json()
-                return PublishResult(
-                    success=True,
-                    article_id=data.get("id"),
-                    url=data.get("url"),
-                    error=None
-                )
-            else:
-                return PublishResult(
-                    success=False,
-                    article_id=None,
-                    url=None,
-                    error=f"API error {response.status_code}: {response.text}"
-                )
-        except Exception as e:
+        except _REQUEST_ERRORS as e:
+            return PublishResult.failed(str(e))
+        
+        rate_limit_remaining = response.headers.get("RateLimit-Remaining")
+        if response.status_code != 201:
+            return PublishResult.failed(
+                f"API error {response.status_code}: {response.text}",
+                rate_limit_remaining
+            )
+        
+        try:
+            data = response.json()
             return PublishResult(
-                success=False,
-                article_id=None,
-                url=None,
-                error=str(e)
+                success=True,
+                article_id=data.get("id"),
+                url=data.get("url"),
+                error=None,
+                rate_limit_remaining=rate_limit_remaining
             )
+        except _RESPONSE_ERRORS as e:
+            return PublishResult.failed(str(e), rate_limit_remaining)
+    
+    async def create_articles_async(self, articles: List[DevToArticle], concurrency: int = 4) -> List[PublishResult]:
+        """Create several articles concurrently; results follow input order."""
+        # Imported here: asyncio alone is most of this module's import time
+        import asyncio
+        import aiohttp
+        
+        if not self.api_key:
+            return [PublishResult.failed("No API key configured") for _ in articles]
+        
+        sem = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency)
+        
+        async with aiohttp.ClientSession(headers=self._headers(), connector=connector) as session:
+            async def post(article: DevToArticle) -> PublishResult:
+                retries = self.MAX_RETRIES
+                async with sem:
+                    while True:
+                        try:
+                            async with session.post(
+                                f"{self.BASE_URL}/articles",
+                                data=self._article_payload(article)
+                            ) as resp:
+                                rate_limit_remaining = resp.headers.get("RateLimit-Remaining")
+                                if resp.status in self.RETRY_STATUSES and retries > 0:
+                                    # Same policy as the session's Retry:
+                                    # Retry-After if sent, else exponential backoff
+                                    backoff = self.BACKOFF_FACTOR * 2 ** (self.MAX_RETRIES - retries)
+                                    retries -= 1
+                                    await asyncio.sleep(_retry_after_seconds(resp.headers.get("Retry-After"), backoff))
+                                    continue
+                                if resp.status != 201:
+                                    return PublishResult.failed(
+                                        f"API error {resp.status}: {await resp.text()}",
+                                        rate_limit_remaining
+                                    )
+                                data = await resp.json()
+                        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                            return PublishResult.failed(str(e))
+                        
+                        return PublishResult(
+                            success=True,
+                            article_id=data.get("id"),
+                            url=data.get("url"),
+                            error=None,
+                            rate_limit_remaining=rate_limit_remaining
+                        )
+            
+            return await asyncio.gather(*(post(article) for article in articles))
+    
+    def create_articles_bulk(self, articles: List[DevToArticle], concurrency: int = 4) -> List[PublishResult]:
+        """Create several articles, overlapping the per-request latency."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            pass  # Optional; fall back to the pooled session
+        else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:  # No loop running, so asyncio.run is safe
+                return asyncio.run(self.create_articles_async(articles, concurrency))
+            # Called from within an event loop; asyncio.run would raise there
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self.create_article, articles))
     
     def get_my_articles(self, page: int = 1, per_page: int = 10) -> List[Dict]:
         """Get list of my published articles."""
@@ -141,67 +311,103 @@ class DevToClient:
             return []
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.BASE_URL}/articles/me",
-                headers=self._headers(),
                 params={"page": page, "per_page": per_page}
             )
             if response.status_code == 200:
                 return response.json()
             return []
-        except:
+        except _RESPONSE_ERRORS:
             return []
     
+    def iter_my_articles(self, per_page: int = 30) -> Iterator[Dict]:
+        """Yield my articles page by page, fetching the next page lazily."""
+        for page in itertools.count(1):
+            articles = self.get_my_articles(page=page, per_page=per_page)
+            yield from articles
+            if len(articles) < per_page:
+                return
+    
     def delete_article(self, article_id: int) -> bool:
         """Delete an article by ID."""
         if not self.api_key:
             return False
         
         try:
-            response = requests.delete(
-                f"{self.BASE_URL}/articles/{article_id}",
-                headers=self._headers()
-            )
+            response = self._session.delete(f"{self.BASE_URL}/articles/{article_id}")
             return response.status_code == 204 or response.status_code == 200
-        except:
+        except _REQUEST_ERRORS:
             return False
 
 
-def session_log_to_article(log_path: Path, series: str = "Learning in Public") -> DevToArticle:
-    """Convert a session log to a Dev.to article."""
-    content = log_path.read_text(encoding='utf-8')
-    
-    # Extract date from filename
-    date_str = log_path.stem.split("_")[0]
-    
-    # Extract title from content or generate one
-    lines = content.split("\n")
-    title = f"Learning in Public: {date_str}"
-    for line in lines:
-        if line.startswith("# "):
-            title = line[2:].strip()
-            break
-    
-    # Convert to Dev.to markdown format
-    body = f"""---
+_TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+_TITLE_SCAN_CHARS = 4096
+_SESSION_LOG_TAGS = ("learninginpublic", "dataengineering", "python", "til")
+_WEEKLY_TAGS = ("learninginpublic", "dataengineering", "weeklyreview", "progress")
+
+# Article bodies: frontmatter + content + footer, assembled once at import
+_ARTICLE_TEMPLATE = """---
 title: {title}
 published: false
-description: Daily learning log from my Data Engineering journey
-tags: learninginpublic, dataengineering, python, til
+description: %s
+tags: %s
 series: {series}
 ---
 
-{content}
+{head}{rest}
 
 ---
 
-*This post was auto-generated from my [Learning-in-Public workflow](https://github.com/oronculzac/personal-ai-os)*
+*%s*
 """
+_SESSION_TEMPLATE = _ARTICLE_TEMPLATE % (
+    "Daily learning log from my Data Engineering journey",
+    ", ".join(_SESSION_LOG_TAGS),
+    "This post was auto-generated from my [Learning-in-Public workflow](https://github.com/oronculzac/personal-ai-os)",
+)
+_WEEKLY_TEMPLATE = _ARTICLE_TEMPLATE % (
+    "Weekly summary of my Data Engineering learning journey",
+    ", ".join(_WEEKLY_TAGS),
+    "Auto-generated by my [Personal AI OS](https://github.com/oronculzac/personal-ai-os)",
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_article(path_str: str, mtime_ns: int, series: str) -> tuple:
+    """Read and convert a session log; keyed on mtime so edits invalidate it."""
+    log_path = Path(path_str)
+    with log_path.open('r', encoding='utf-8') as f:
+        head = f.read(_TITLE_SCAN_CHARS)
+        rest = f.read()
+    
+    # Extract date from filename
+    date_str = log_path.stem.split("_")[0]
+    
+    # Extract title from content or generate one; the heading is almost
+    # always near the top, so only scan the rest when the head has none
+    # (or the heading line runs past the end of the head)
+    match = _TITLE_RE.search(head)
+    if rest and (not match or match.end() == len(head)):
+        match = _TITLE_RE.search(head + rest)
+    title = match.group(1).strip() if match else f"Learning in Public: {date_str}"
+    
+    # Convert to Dev.to markdown format
+    body = _SESSION_TEMPLATE.format_map(
+        {"title": title, "series": series, "head": head, "rest": rest}
+    )
+    
+    return title, body
+
+
+def session_log_to_article(log_path: Path, series: str = "Learning in Public") -> DevToArticle:
+    """Convert a session log to a Dev.to article."""
+    title, body = _build_article(str(log_path), log_path.stat().st_mtime_ns, series)
     
     return DevToArticle(
         title=title,
         body_markdown=body,
-        tags=["learninginpublic", "dataengineering", "python", "til"],
+        tags=list(_SESSION_LOG_TAGS),
         published=False,  # Draft by default
         series=series
     )
@@ -211,25 +417,14 @@ def weekly_summary_to_article(summary_content: str, week_range: str) -> DevToArt
     """Convert a weekly summary to a Dev.to article."""
     title = f"Weekly Learning Recap: {week_range}"
     
-    body = f"""---
-title: {title}
-published: false
-description: Weekly summary of my Data Engineering learning journey
-tags: learninginpublic, dataengineering, weeklyreview, progress
-series: Weekly Recaps
----
-
-{summary_content}
-
----
-
-*Auto-generated by my [Personal AI OS](https://github.com/oronculzac/personal-ai-os)*
-"""
+    body = _WEEKLY_TEMPLATE.format_map(
+        {"title": title, "series": "Weekly Recaps", "head": summary_content, "rest": ""}
+    )
     
     return DevToArticle(
         title=title,
         body_markdown=body,
-        tags=["learninginpublic", "dataengineering", "weeklyreview", "progress"],
+        tags=list(_WEEKLY_TAGS),
         published=False,
         series="Weekly Recaps"
     )
@@ -237,8 +432,6 @@ series: Weekly Recaps
 
 # CLI
 if __name__ == "__main__":
-    import sys
-    
     client = DevToClient()
     
     if len(sys.argv) > 1:
@@ -255,10 +448,11 @@ if __name__ == "__main__":
                 print(f"❌ Connection failed: {result['error']}")
         
         elif command == "--articles":
-            articles = client.get_my_articles()
-            print(f"Your articles ({len(articles)}):")
-            for a in articles:
+            print("Your articles:")
+            count = 0
+            for count, a in enumerate(itertools.islice(client.iter_my_articles(), 50), 1):
                 print(f"  - [{a.get('published', False) and '✓' or '○'}] {a.get('title')}")
+            print(f"({count} shown)")
         
         elif command == "--publish" and len(sys.argv) > 2:
             log_path = Path(sys.argv[2])
@@ -8,18 +8,164 @@ import subprocess
 import sys
 import os
 import json
+import errno
+import hashlib
+import time
+import re
+import shutil
+import types
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import platform
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Version probes run by the check_* methods, keyed by probe name
+PROBES = {
+    'docker': ['docker', '--version'],
+    'docker_ps': ['docker', 'ps'],
+    'docker_compose': ['docker', 'compose', 'version'],
+    'terraform': ['terraform', '--version'],
+    'gcloud': ['gcloud', '--version'],
+    'git': ['git', '--version'],
+    'java': ['java', '-version'],
+}
+
+# Tools each course module needs, in report order
+MODULE_REQUIREMENTS = types.MappingProxyType({
+    1: ('Python', 'Docker', 'Docker Compose', 'Terraform', 'GCloud CLI'),
+    2: ('Python', 'Docker', 'Virtual Env'),
+    3: ('Python', 'GCloud CLI', 'Virtual Env'),
+    4: ('Python', 'Virtual Env'),
+    5: ('Python', 'Java', 'Virtual Env'),
+    6: ('Python', 'Docker', 'Virtual Env'),
+})
+
+# Validation results are reused across invocations for a short while
+CACHE_FILE = Path.home() / ".cache" / "personal-ai-os" / "env_probe.json"
+CACHE_TTL_SECONDS = 300
+
+# The newline printed before each exit sentinel is not part of the output
+_PROBE_OUTPUT_RE = re.compile(r'^====(\w+)====\n(.*?)\n^====exit (\d+)====$', re.S | re.M)
 
 
 class EnvironmentSetup:
     """Manage data engineering environment setup and validation"""
     
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        import platform  # Only needed once an instance exists
+        
         self.os_type = platform.system()
         self.python_version = sys.version_info
         self.checks = {}
+        self.use_cache = use_cache
+        self._probe_cache = None
+    
+    def _cache_key(self) -> str:
+        """Fingerprint of what the checks depend on: PATH, OS, Python and cwd"""
+        raw = "|".join([
+            os.environ.get("PATH", ""),
+            self.os_type,
+            sys.version,
+            os.getcwd()
+        ])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def _load_cached_checks(self) -> Optional[Dict[str, Tuple[bool, str]]]:
+        """Return cached check results if fresh and for this environment"""
+        try:
+            cached = json.loads(CACHE_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get("key") != self._cache_key():
+            return None
+        if time.time() - cached.get("ts", 0) > CACHE_TTL_SECONDS:
+            return None
+        return {tool: tuple(result) for tool, result in cached.get("checks", {}).items()}
+    
+    def _save_cached_checks(self, checks: Dict[str, Tuple[bool, str]]):
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CACHE_FILE.write_text(
+                json.dumps({"ts": time.time(), "key": self._cache_key(), "checks": checks}),
+                encoding='utf-8'
+            )
+        except OSError:
+            pass  # Caching is best-effort
+    
+    def invalidate_cache(self):
+        """Drop cached results after the environment has been changed"""
+        self.checks = {}
+        self._probe_cache = None
+        try:
+            CACHE_FILE.unlink()
+        except OSError:
+            pass
+    
+    def _batch_probe_versions(self) -> Dict[str, subprocess.CompletedProcess]:
+        """Run every probe in one bash invocation instead of a spawn per tool"""
+        if self._probe_cache is not None:
+            return self._probe_cache
+        
+        self._probe_cache = {}
+        bash = shutil.which('bash') if self.os_type != "Windows" else None
+        if not bash:
+            return self._probe_cache
+        
+        # Tools missing from PATH are reported by _probe without spawning.
+        # The exit sentinel is preceded by a newline so it starts its own
+        # line even when a tool's output does not end with one.
+        script = "\n".join(
+            f'echo "===={name}===="; {" ".join(cmd)} 2>&1; rc=$?; printf \'\\n====exit %d====\\n\' "$rc"'
+            for name, cmd in PROBES.items()
+            if shutil.which(cmd[0])
+        )
+        if not script:
+            return self._probe_cache
+        
+        try:
+            # Probe stderr is folded into stdout by the script itself
+            result = subprocess.run(
+                [bash, '-c', script],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=10
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return self._probe_cache
+        
+        stdout = result.stdout.decode('utf-8', 'replace')
+        for name, output, returncode in _PROBE_OUTPUT_RE.findall(stdout):
+            self._probe_cache[name] = subprocess.CompletedProcess(
+                PROBES[name], int(returncode), stdout=output, stderr=''
+            )
+        return self._probe_cache
+    
+    def _probe(self, name: str) -> subprocess.CompletedProcess:
+        """Result of one probe, from the batch run or a direct subprocess call"""
+        binary = PROBES[name][0]
+        if shutil.which(binary) is None:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), binary)
+        
+        result = self._batch_probe_versions().get(name)
+        if result is None:
+            # Only java reports its version on stderr
+            result = subprocess.run(
+                PROBES[name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE if name == 'java' else subprocess.DEVNULL,
+                timeout=5
+            )
+            return subprocess.CompletedProcess(
+                result.args,
+                result.returncode,
+                stdout=result.stdout.decode('utf-8', 'replace'),
+                stderr=result.stderr.decode('utf-8', 'replace') if result.stderr else ''
+            )
+        if result.returncode == 127:
+            # bash's "command not found"
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), binary)
+        return result
         
     def check_python(self) -> Tuple[bool, str]:
         """Check Python version"""
@@ -33,21 +179,12 @@ class EnvironmentSetup:
     def check_docker(self) -> Tuple[bool, str]:
         """Check if Docker is installed and running"""
         try:
-            result = subprocess.run(
-                ['docker', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._probe('docker')
             
             if result.returncode == 0:
                 version = result.stdout.strip()
                 # Test if Docker daemon is running
-                test_result = subprocess.run(
-                    ['docker', 'ps'],
-                    capture_output=True,
-                    timeout=5
-                )
+                test_result = self._probe('docker_ps')
                 
                 if test_result.returncode == 0:
                     return True, f"✓ {version} (running)"
@@ -66,12 +203,7 @@ class EnvironmentSetup:
     def check_docker_compose(self) -> Tuple[bool, str]:
         """Check Docker Compose installation"""
         try:
-            result = subprocess.run(
-                ['docker', 'compose', 'version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._probe('docker_compose')
             
             if result.returncode == 0:
                 version = result.stdout.strip()
@@ -85,12 +217,7 @@ class EnvironmentSetup:
     def check_terraform(self) -> Tuple[bool, str]:
         """Check Terraform installation"""
         try:
-            result = subprocess.run(
-                ['terraform', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._probe('terraform')
             
             if result.returncode == 0:
                 version = result.stdout.split('\\n')[0]
@@ -106,12 +233,7 @@ class EnvironmentSetup:
     def check_gcloud(self) -> Tuple[bool, str]:
         """Check Google Cloud SDK"""
         try:
-            result = subprocess.run(
-                ['gcloud', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._probe('gcloud')
             
             if result.returncode == 0:
                 version_line = result.stdout.split('\\n')[0]
@@ -127,12 +249,7 @@ class EnvironmentSetup:
     def check_git(self) -> Tuple[bool, str]:
         """Check Git installation"""
         try:
-            result = subprocess.run(
-                ['git', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._probe('git')
             
             if result.returncode == 0:
                 version = result.stdout.strip()
@@ -148,12 +265,7 @@ class EnvironmentSetup:
     def check_java(self) -> Tuple[bool, str]:
         """Check Java installation (needed for Spark)"""
         try:
-            result = subprocess.run(
-                ['java', '-version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._probe('java')
             
             # Java outputs to stderr
             output = result.stderr if result.stderr else result.stdout
@@ -196,6 +308,7 @@ class EnvironmentSetup:
             )
             
             if result.returncode == 0:
+                self.invalidate_cache()
                 return True, f"✓ Created virtual environment at {venv_path}"
             else:
                 return False, f"✗ Failed to create venv: {result.stderr}"
@@ -221,6 +334,7 @@ class EnvironmentSetup:
             )
             
             if result.returncode == 0:
+                self.invalidate_cache()
                 return True, f"✓ Installed packages from {requirements_file}"
             else:
                 return False, f"✗ Installation failed: {result.stderr}"
@@ -230,62 +344,78 @@ class EnvironmentSetup:
     
     def validate_all(self) -> Dict[str, Tuple[bool, str]]:
         """Run all validation checks"""
-        checks = {
-            'Python': self.check_python(),
-            'Docker': self.check_docker(),
-            'Docker Compose': self.check_docker_compose(),
-            'Terraform': self.check_terraform(),
-            'GCloud CLI': self.check_gcloud(),
-            'Git': self.check_git(),
-            'Java': self.check_java(),
-            'Virtual Env': self.check_virtualenv()
+        if self.use_cache:
+            cached = self._load_cached_checks()
+            if cached is not None:
+                self.checks = cached
+                return cached
+        
+        check_methods = {
+            'Python': self.check_python,
+            'Docker': self.check_docker,
+            'Docker Compose': self.check_docker_compose,
+            'Terraform': self.check_terraform,
+            'GCloud CLI': self.check_gcloud,
+            'Git': self.check_git,
+            'Java': self.check_java,
+            'Virtual Env': self.check_virtualenv
         }
         
+        # One batched probe for all tools, then parse; checks that fall back
+        # to their own subprocess call run concurrently. The dict is
+        # pre-seeded with the tool names to keep the report order.
+        self._batch_probe_versions()
+        checks = dict.fromkeys(check_methods)
+        with ThreadPoolExecutor(max_workers=len(check_methods)) as executor:
+            futures = {executor.submit(method): name for name, method in check_methods.items()}
+            for future in as_completed(futures):
+                checks[futures[future]] = future.result()
+        
         self.checks = checks
+        if self.use_cache:
+            self._save_cached_checks(checks)
         return checks
     
     def print_report(self):
         """Print validation report"""
-        print("\\n" + "="*50)
-        print("Environment Setup Validation Report")
-        print("="*50 + "\\n")
-        
         if not self.checks:
             self.validate_all()
         
+        lines = [
+            "\\n" + "="*50,
+            "Environment Setup Validation Report",
+            "="*50 + "\\n",
+        ]
+        
         passed = 0
         total = len(self.checks)
         
         for tool, (status, message) in self.checks.items():
-            print(f"{tool:20} {message}")
+            lines.append(f"{tool:20} {message}")
             if status:
                 passed += 1
         
-        print("\\n" + "-"*50)
         percentage = int((passed / total) * 100)
-        print(f"Status: {passed}/{total} checks passed ({percentage}%)")
-        print("-"*50 + "\\n")
+        lines += [
+            "\\n" + "-"*50,
+            f"Status: {passed}/{total} checks passed ({percentage}%)",
+            "-"*50 + "\\n",
+        ]
         
         if percentage < 100:
-            print("⚠ Some tools are missing or not configured properly.")
-            print("Run with --help to see setup instructions.\\n")
+            lines.append("⚠ Some tools are missing or not configured properly.")
+            lines.append("Run with --help to see setup instructions.\\n")
         else:
-            print("✅ All checks passed! Environment is ready.\\n")
+            lines.append("✅ All checks passed! Environment is ready.\\n")
+        
+        # One write instead of a print (and stdout lock) per line
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def setup_for_module(self, module_num: int):
         """Setup environment for specific course module"""
         print(f"\\nSetting up environment for Module {module_num}...\\n")
         
-        module_requirements = {
-            1: ['Python', 'Docker', 'Docker Compose', 'Terraform', 'GCloud CLI'],
-            2: ['Python', 'Docker', 'Virtual Env'],
-            3: ['Python', 'GCloud CLI', 'Virtual Env'],
-            4: ['Python', 'Virtual Env'],
-            5: ['Python', 'Java', 'Virtual Env'],
-            6: ['Python', 'Docker', 'Virtual Env']
-        }
-        
-        required = module_requirements.get(module_num, [])
+        required = MODULE_REQUIREMENTS.get(module_num, ())
         
         if not required:
             print(f"Unknown module: {module_num}")
@@ -296,12 +426,7 @@ class EnvironmentSetup:
         if not self.checks:
             self.validate_all()
         
-        missing = []
-        for tool in required:
-            if tool in self.checks:
-                status, message = self.checks[tool]
-                if not status:
-                    missing.append(tool)
+        missing = [tool for tool in required if not self.checks.get(tool, (True,))[0]]
         
         if missing:
             print(f"⚠ Missing tools: {', '.join(missing)}")
@@ -319,12 +444,14 @@ def main():
     parser.add_argument('--module', type=int, help='Check setup for specific module (1-6)')
     parser.add_argument('--create-venv', metavar='PATH', help='Create virtual environment')
     parser.add_argument('--install-req', metavar='FILE', help='Install from requirements.txt')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached results and re-probe all tools')
     
     args = parser.parse_args()
     
-    setup = EnvironmentSetup()
+    setup = EnvironmentSetup(use_cache=not args.no_cache)
     
-    if args.validate or (not any(vars(args).values())):
+    actions = (args.validate, args.module, args.create_venv, args.install_req)
+    if args.validate or not any(actions):
         setup.validate_all()
         setup.print_report()
     
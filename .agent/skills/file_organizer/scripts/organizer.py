@@ -5,25 +5,58 @@ Part of Antigravity Skills & Cowork System
 """
 
 import argparse
+import bisect
 import json
+import mmap
+import os
 import shutil
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 
+# blake3 is optional; hashlib's blake2b is the stdlib default
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Size buckets: < 1 MB, < 10 MB, < 100 MB, larger
+SIZE_BOUNDS = (1_000_000, 10_000_000, 100_000_000)
+SIZE_CATEGORIES = ('Small', 'Medium', 'Large', 'Huge')
+# Inventories at least this large are bucketed with NumPy when available
+NUMPY_SIZE_THRESHOLD = 10_000
+
+
 class FileOrganizer:
     """Organize and manage files with safety controls"""
     
-    def __init__(self, target_path, dry_run=True):
+    # Bytes read per file in the duplicate-detection prefilter
+    PREFIX_HASH_BYTES = 4096
+    # Read size for the manual hashing loop (pre-3.11 Pythons)
+    HASH_BUFFER_SIZE = 1024 * 1024
+    # Files above this size are hashed straight from a memory map
+    MMAP_THRESHOLD = 1024 * 1024
+    
+    def __init__(self, target_path, dry_run=True, hash_algorithm=None, follow_symlinks=False):
         self.target_path = Path(target_path)
         self.dry_run = dry_run
+        self.follow_symlinks = follow_symlinks
+        # Directory -> names present (or claimed by planned operations)
+        self._dir_name_cache = {}
+        self.hash_algorithm = hash_algorithm or ('blake3' if blake3 else 'blake2b')
         self.operations = []
-        self.backup_data = {
+        # Backup journal (JSONL: header line, then one line per operation),
+        # opened on the first completed operation and appended as we go
+        self.backup_header = {
             'timestamp': datetime.now().isoformat(),
-            'target_path': str(self.target_path),
-            'operations': []
+            'target_path': str(self.target_path)
         }
+        self._backup_path = None
+        self._backup_file = None
+        self._backup_lock = threading.Lock()
         
         # File type categories
         self.categories = {
@@ -37,6 +70,12 @@ class FileOrganizer:
             'Code': ['.py', '.js', '.html', '.css', '.java', '.cpp', '.c', '.h', '.json', '.xml', '.yml', '.yaml'],
             'Executables': ['.exe', '.msi', '.dmg', '.app', '.deb', '.rpm']
         }
+        
+        # Extension -> category; the first category listing an extension wins
+        self._ext_to_category = {}
+        for cat_name, extensions in self.categories.items():
+            for ext in extensions:
+                self._ext_to_category.setdefault(ext, cat_name)
     
     def scan_folder(self):
         """Scan folder and return file inventory"""
@@ -45,33 +84,61 @@ class FileOrganizer:
             return []
         
         files = []
-        for item in self.target_path.iterdir():
-            if item.is_file():
-                files.append({
-                    'path': item,
-                    'name': item.name,
-                    'ext': item.suffix.lower(),
-                    'size': item.stat().st_size,
-                    'modified': datetime.fromtimestamp(item.stat().st_mtime),
-                    'created': datetime.fromtimestamp(item.stat().st_ctime)
-                })
+        # scandir yields the file type with the entry and caches its stat,
+        # so each file costs one stat call instead of three. Symlinks are
+        # skipped unless asked for, which keeps is_file() free of syscalls.
+        with os.scandir(self.target_path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=self.follow_symlinks):
+                    files.append(self._file_info(entry))
         
         return files
     
+    def scan_folder_recursive(self):
+        """Scan folder and all subfolders and return file inventory"""
+        if not self.target_path.exists():
+            print(f"✗ Path does not exist: {self.target_path}")
+            return []
+        
+        files = []
+        # Same scandir walk as os.walk, but keeping the DirEntry objects so
+        # their cached type/stat are reused; symlinked folders are not entered
+        pending = [self.target_path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=self.follow_symlinks):
+                            files.append(self._file_info(entry))
+            except PermissionError as e:
+                print(f"✗ Skipping {directory}: {e}")
+        
+        return files
+    
+    def _file_info(self, entry):
+        """Inventory record for a scandir entry"""
+        st = entry.stat(follow_symlinks=self.follow_symlinks)
+        path = Path(entry.path)
+        return {
+            'path': path,
+            'name': entry.name,
+            'ext': path.suffix.lower(),
+            'size': st.st_size,
+            # Raw timestamps; converted to datetime only where formatted
+            'mtime': st.st_mtime,
+            'ctime': st.st_ctime,
+            'ino': st.st_ino
+        }
+    
     def categorize_by_type(self, files):
         """Categorize files by type"""
         categorized = defaultdict(list)
         
         for file_info in files:
-            ext = file_info['ext']
-            category = 'Other'
-            
-            # Find matching category
-            for cat_name, extensions in self.categories.items():
-                if ext in extensions:
-                    category = cat_name
-                    break
-            
+            category = self._ext_to_category.get(file_info['ext'], 'Other')
             categorized[category].append(file_info)
         
         return dict(categorized)
@@ -79,17 +146,17 @@ class FileOrganizer:
     def categorize_by_date(self, files, mode='monthly'):
         """Categorize files by date"""
         categorized = defaultdict(list)
+        threshold = (datetime.now() - timedelta(days=180)).timestamp()  # 6 months
         
         for file_info in files:
-            mod_date = file_info['modified']
+            mtime = file_info['mtime']
             
             if mode == 'monthly':
-                category = mod_date.strftime('%Y-%m')
+                category = datetime.fromtimestamp(mtime).strftime('%Y-%m')
             elif mode == 'yearly':
-                category = mod_date.strftime('%Y')
+                category = datetime.fromtimestamp(mtime).strftime('%Y')
             else:  # recent vs old
-                threshold = datetime.now() - timedelta(days=180)  # 6 months
-                category = 'Recent' if mod_date > threshold else 'Old'
+                category = 'Recent' if mtime > threshold else 'Old'
             
             categorized[category].append(file_info)
         
@@ -99,19 +166,21 @@ class FileOrganizer:
         """Categorize files by size"""
         categorized = defaultdict(list)
         
-        for file_info in files:
-            size = file_info['size']
-            
-            if size < 1_000_000:  # < 1 MB
-                category = 'Small'
-            elif size < 10_000_000:  # < 10 MB
-                category = 'Medium'
-            elif size < 100_000_000:  # < 100 MB
-                category = 'Large'
+        buckets = None
+        if len(files) >= NUMPY_SIZE_THRESHOLD:
+            try:
+                import numpy as np
+            except ImportError:
+                pass  # Optional; the bisect loop below is fine
             else:
-                category = 'Huge'
-            
-            categorized[category].append(file_info)
+                sizes = np.fromiter((fi['size'] for fi in files), dtype=np.int64, count=len(files))
+                buckets = np.digitize(sizes, SIZE_BOUNDS).tolist()
+        
+        if buckets is None:
+            buckets = [bisect.bisect_right(SIZE_BOUNDS, fi['size']) for fi in files]
+        
+        for bucket, file_info in zip(buckets, files):
+            categorized[SIZE_CATEGORIES[bucket]].append(file_info)
         
         return dict(categorized)
     
@@ -119,80 +188,153 @@ class FileOrganizer:
         """Find duplicate files by hash"""
         hash_dict = defaultdict(list)
         
+        # Only files sharing a size can be duplicates
+        size_counts = Counter(fi['size'] for fi in files)
+        candidates = [fi for fi in files if size_counts[fi['size']] > 1]
+        
         print("Calculating file hashes...")
-        for file_info in files:
-            file_hash = self._calculate_hash(file_info['path'])
-            hash_dict[file_hash].append(file_info)
+        # Cheap first pass over the head of larger files; only those still
+        # colliding on (size, prefix) are read in full
+        large = [fi for fi in candidates if fi['size'] > self.PREFIX_HASH_BYTES]
+        prefixes = self._hash_files(large, self._calculate_prefix_hash)
+        prefix_counts = Counter((fi['size'], prefixes[id(fi)]) for fi in large)
+        candidates = [
+            fi for fi in candidates
+            if fi['size'] <= self.PREFIX_HASH_BYTES
+            or prefix_counts[(fi['size'], prefixes[id(fi)])] > 1
+        ]
+        
+        hashes = self._hash_files(candidates, self._calculate_hash)
+        
+        # Group in scan order so duplicate sets list files as before
+        for file_info in candidates:
+            hash_dict[hashes[id(file_info)]].append(file_info)
         
         # Filter to only duplicates
         duplicates = {h: f for h, f in hash_dict.items() if len(f) > 1}
         
         return duplicates
     
-    def _calculate_hash(self, file_path, algorithm='md5'):
+    def _hash_files(self, files, hash_func):
+        """Hash files concurrently; returns {id(file_info): digest}"""
+        if not files:
+            return {}
+        
+        # Hashing is read-bound: overlap reads across threads, submitting in
+        # inode order to roughly follow on-disk layout
+        by_inode = sorted(files, key=lambda fi: fi.get('ino', 0))
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            return dict(zip(
+                (id(fi) for fi in by_inode),
+                executor.map(hash_func, (fi['path'] for fi in by_inode))
+            ))
+    
+    def _new_hash(self, algorithm=None):
+        """Create a hash object for the configured algorithm"""
+        algorithm = algorithm or self.hash_algorithm
+        if algorithm == 'blake3':
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.new(algorithm)
+    
+    def _calculate_prefix_hash(self, file_path):
+        """Hash only the first PREFIX_HASH_BYTES of a file"""
+        hash_obj = self._new_hash()
+        with open(file_path, 'rb') as f:
+            hash_obj.update(f.read(self.PREFIX_HASH_BYTES))
+        return hash_obj.hexdigest()
+    
+    def _calculate_hash(self, file_path, algorithm=None):
         """Calculate file hash"""
-        hash_obj = hashlib.md5()
-        
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
+            if os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                # Hash pages from the page cache without copying into bytes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_obj = self._new_hash(algorithm)
+                    hash_obj.update(mm)
+                    return hash_obj.hexdigest()
+            
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+: C-level loop
+                return hashlib.file_digest(f, lambda: self._new_hash(algorithm)).hexdigest()
+            
+            hash_obj = self._new_hash(algorithm)
+            for chunk in iter(lambda: f.read(self.HASH_BUFFER_SIZE), b''):
                 hash_obj.update(chunk)
         
         return hash_obj.hexdigest()
     
     def organize(self, categorized_files):
-        """Organize files into category folders"""
+        """Plan moves of files into category folders (see execute_operations)"""
         self.operations = []
+        self._dir_name_cache = {}
         
         for category, files in categorized_files.items():
-            # Create category folder
             category_path = self.target_path / category
             
-            if not self.dry_run:
-                category_path.mkdir(exist_ok=True)
-            
-            # Move files
             for file_info in files:
                 source = file_info['path']
-                dest = category_path / file_info['name']
                 
                 # Handle name conflicts
-                if dest.exists():
-                    dest = self._get_unique_name(dest)
+                dest = self._get_unique_name(category_path / file_info['name'])
                 
-                operation = {
+                self.operations.append({
                     'action': 'move',
                     'source': str(source),
                     'destination': str(dest),
                     'category': category
-                }
-                
-                self.operations.append(operation)
-                self.backup_data['operations'].append(operation)
-                
-                if not self.dry_run:
-                    try:
-                        shutil.move(str(source), str(dest))
-                    except Exception as e:
-                        print(f"✗ Error moving {source.name}: {e}")
+                })
         
         return self.operations
     
+    def _fsync_dirs(self, dirs):
+        """fsync directory entries so completed moves survive a crash"""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return  # Windows cannot open directories for fsync
+        
+        for directory in dirs:
+            try:
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
+    def _dir_names(self, directory):
+        """Names in a directory, listed once and then tracked in memory"""
+        names = self._dir_name_cache.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as it:
+                    names = {entry.name for entry in it}
+            except FileNotFoundError:
+                names = set()
+            self._dir_name_cache[directory] = names
+        return names
+    
     def _get_unique_name(self, path):
-        """Generate unique filename if conflict exists"""
+        """Generate unique filename if conflict exists, and claim it"""
+        taken = self._dir_names(path.parent)
         counter = 1
         stem = path.stem
         suffix = path.suffix
         parent = path.parent
         
-        while path.exists():
+        while path.name in taken:
             path = parent / f"{stem}_{counter}{suffix}"
             counter += 1
         
+        taken.add(path.name)
         return path
     
     def batch_rename(self, files, pattern, start=1):
-        """Batch rename files with pattern"""
+        """Plan batch renames with pattern (see execute_operations)"""
         self.operations = []
+        self._dir_name_cache = {}
         
         for idx, file_info in enumerate(files, start):
             source = file_info['path']
@@ -201,27 +343,21 @@ class FileOrganizer:
             if pattern == 'sequential':
                 new_name = f"file_{idx:03d}{source.suffix}"
             elif pattern == 'date_prefix':
-                date_str = file_info['modified'].strftime('%Y-%m-%d')
+                date_str = datetime.fromtimestamp(file_info['mtime']).strftime('%Y-%m-%d')
                 new_name = f"{date_str}_{source.name}"
             else:
                 new_name = pattern.format(index=idx, name=source.stem, ext=source.suffix)
             
-            dest = source.parent / new_name
+            # The source name is vacated by this rename; avoid clobbering any
+            # other existing (or already planned) name
+            self._dir_names(source.parent).discard(source.name)
+            dest = self._get_unique_name(source.parent / new_name)
             
-            operation = {
+            self.operations.append({
                 'action': 'rename',
                 'source': str(source),
                 'destination': str(dest)
-            }
-            
-            self.operations.append(operation)
-            self.backup_data['operations'].append(operation)
-            
-            if not self.dry_run:
-                try:
-                    source.rename(dest)
-                except Exception as e:
-                    print(f"✗ Error renaming {source.name}: {e}")
+            })
         
         return self.operations
     
@@ -260,30 +396,79 @@ class FileOrganizer:
         
         print(f"\n🔄 Executing {len(self.operations)} operations...\n")
         
-        success_count = 0
+        # Destination folders are independent of each other, so each runs on
+        # its own worker; operations within a folder stay in planned order
+        by_dest_dir = defaultdict(list)
         for op in self.operations:
-            try:
-                # Operations were already executed in organize()
-                success_count += 1
-            except Exception as e:
-                print(f"✗ Error: {e}")
+            by_dest_dir[Path(op['destination']).parent].append(op)
+        
+        success_count = 0
+        if by_dest_dir:
+            self._target_dev = os.stat(self.target_path).st_dev
+            with ThreadPoolExecutor(max_workers=min(8, len(by_dest_dir))) as executor:
+                success_count = sum(executor.map(self._execute_group, by_dest_dir.items()))
+            
+            # Persist the batch of renames with one fsync per directory
+            self._fsync_dirs([self.target_path] + list(by_dest_dir))
         
         print(f"\n✅ Completed: {success_count}/{len(self.operations)} operations")
     
-    def save_backup(self, backup_path=None):
-        """Save backup data for undo capability"""
-        if backup_path is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_path = Path('.agent/backups') / f'org_{timestamp}.json'
+    def _execute_group(self, group):
+        """Run the operations targeting one directory; returns successes"""
+        dest_dir, ops = group
+        dest_dir.mkdir(exist_ok=True)
         
-        backup_path = Path(backup_path)
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        # Within one filesystem a plain rename is enough; shutil.move is
+        # only needed for its copy fallback across devices
+        same_device = os.stat(dest_dir).st_dev == self._target_dev
         
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(self.backup_data, f, indent=2)
+        success_count = 0
+        for op in ops:
+            source, dest = op['source'], op['destination']
+            try:
+                if op['action'] == 'move' and not same_device:
+                    shutil.move(source, dest)
+                else:
+                    os.rename(source, dest)
+            except Exception as e:
+                verb = 'moving' if op['action'] == 'move' else 'renaming'
+                print(f"✗ Error {verb} {Path(source).name}: {e}")
+                continue
+            
+            self._journal_operation(op)
+            success_count += 1
         
-        print(f"\n💾 Backup saved: {backup_path}")
-        return backup_path
+        return success_count
+    
+    def _open_backup(self):
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self._backup_path = Path('.agent/backups') / f'org_{timestamp}.jsonl'
+        self._backup_path.parent.mkdir(parents=True, exist_ok=True)
+        self._backup_file = open(self._backup_path, 'w', encoding='utf-8')
+        self._backup_file.write(json.dumps(self.backup_header) + "\n")
+    
+    def _journal_operation(self, operation):
+        """Append a completed operation to the backup journal"""
+        with self._backup_lock:
+            if self._backup_file is None:
+                self._open_backup()
+            self._backup_file.write(json.dumps(operation) + "\n")
+    
+    def save_backup(self, backup_path=None):
+        """Save backup data for undo capability"""
+        if self._backup_file is None:
+            self._open_backup()
+        self._backup_file.close()
+        self._backup_file = None
+        
+        if backup_path is not None:
+            backup_path = Path(backup_path)
+            backup_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(self._backup_path), str(backup_path))
+            self._backup_path = backup_path
+        
+        print(f"\n💾 Backup saved: {self._backup_path}")
+        return self._backup_path
     
     def generate_report(self):
         """Generate organization report"""
@@ -319,11 +504,20 @@ def main():
                        help="Preview without making changes")
     parser.add_argument("--execute", "-e", action="store_true",
                        help="Execute the organization")
+    parser.add_argument("--follow-symlinks", action="store_true",
+                       help="Include symlinked files (skipped by default)")
+    parser.add_argument("--hash-algorithm", choices=['blake3', 'blake2b', 'md5'],
+                       help="Hash for find-duplicates (default: blake3 if installed, else blake2b)")
     
     args = parser.parse_args()
     
+    if args.hash_algorithm == 'blake3' and blake3 is None:
+        parser.error("blake3 is not installed (pip install blake3)")
+    
     # Initialize organizer
-    organizer = FileOrganizer(args.path, dry_run=not args.execute)
+    organizer = FileOrganizer(args.path, dry_run=not args.execute,
+                              hash_algorithm=args.hash_algorithm,
+                              follow_symlinks=args.follow_symlinks)
     
     # Scan files
     print(f"📂 Scanning: {args.path}\n")
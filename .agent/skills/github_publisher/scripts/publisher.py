@@ -8,8 +8,9 @@ This module handles:
 4. Dry-run mode for preview
 """
 
-import os
 import json
+import functools
+import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -43,11 +44,22 @@ class PublishResult:
     error: Optional[str]
 
 
+DEFAULT_CONFIG_PATH = Path(".agent/config/mcp_config.json")
+
+
 def load_config(config_path: Path = None) -> Optional[PublishConfig]:
     """Load GitHub configuration from mcp_config.json."""
-    if config_path is None:
-        config_path = Path(".agent/config/mcp_config.json")
-    
+    config_path = Path(config_path or DEFAULT_CONFIG_PATH).resolve()
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    # Keyed on mtime so edits to the config still take effect
+    return _load_config_cached(str(config_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Optional[PublishConfig]:
     try:
         with open(config_path, 'r') as f:
             config = json.load(f)
@@ -66,31 +78,23 @@ def load_config(config_path: Path = None) -> Optional[PublishConfig]:
         return None
 
 
+# Conventional commit message per content type: (description, date) -> message
+_COMMIT_TEMPLATES = {
+    "skill": lambda d, ds: f"feat: Add {d or 'new skill'}",
+    "homework": lambda d, ds: f"feat: Complete {d or 'homework'}",
+    "side_quest": lambda d, ds: f"docs: Session log {ds} - {d or 'learning session'}",
+    "learning_log": lambda d, ds: f"docs: Session log {ds} - {d or 'learning session'}",
+    "workflow": lambda d, ds: f"feat: Add {d or 'workflow'}",
+    "manual": lambda d, ds: f"chore: Update {d or 'files'}",
+}
+_DEFAULT_COMMIT_TEMPLATE = _COMMIT_TEMPLATES["manual"]
+
+
 def generate_commit_message(content_type: str, description: str = None) -> str:
     """Generate a conventional commit message based on content type."""
     date_str = datetime.now().strftime("%Y-%m-%d")
-    
-    prefixes = {
-        "skill": "feat",
-        "homework": "feat",
-        "side_quest": "docs",
-        "learning_log": "docs",
-        "workflow": "feat",
-        "manual": "chore"
-    }
-    
-    prefix = prefixes.get(content_type, "chore")
-    
-    if content_type == "skill":
-        return f"{prefix}: Add {description or 'new skill'}"
-    elif content_type == "homework":
-        return f"{prefix}: Complete {description or 'homework'}"
-    elif content_type in ("side_quest", "learning_log"):
-        return f"{prefix}: Session log {date_str} - {description or 'learning session'}"
-    elif content_type == "workflow":
-        return f"{prefix}: Add {description or 'workflow'}"
-    else:
-        return f"{prefix}: Update {description or 'files'}"
+    template = _COMMIT_TEMPLATES.get(content_type, _DEFAULT_COMMIT_TEMPLATE)
+    return template(description, date_str)
 
 
 def get_git_status(repo_path: Path) -> Tuple[List[str], List[str], List[str]]:
@@ -99,32 +103,67 @@ def get_git_status(repo_path: Path) -> Tuple[List[str], List[str], List[str]]:
     Returns: (staged, modified, untracked)
     """
     try:
-        os.chdir(repo_path)
-        
-        # Staged files
-        staged = subprocess.check_output(
-            ["git", "diff", "--cached", "--name-only"],
-            stderr=subprocess.STDOUT
-        ).decode('utf-8').strip().split('\n')
-        staged = [f for f in staged if f]
-        
-        # Modified files
-        modified = subprocess.check_output(
-            ["git", "diff", "--name-only"],
-            stderr=subprocess.STDOUT
-        ).decode('utf-8').strip().split('\n')
-        modified = [f for f in modified if f]
-        
-        # Untracked files
-        untracked = subprocess.check_output(
-            ["git", "ls-files", "--others", "--exclude-standard"],
-            stderr=subprocess.STDOUT
-        ).decode('utf-8').strip().split('\n')
-        untracked = [f for f in untracked if f]
-        
-        return staged, modified, untracked
+        # One status call instead of diff --cached / diff / ls-files
+        output = subprocess.check_output(
+            ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"],
+            stderr=subprocess.STDOUT,
+            cwd=repo_path
+        ).decode('utf-8')
     except subprocess.CalledProcessError as e:
         return [], [], []
+    
+    staged, modified, untracked = [], [], []
+    records = iter(output.split('\0'))
+    for record in records:
+        kind = record[:1]
+        if kind == '?':
+            untracked.append(record[2:])
+        elif kind in ('1', '2', 'u'):
+            # "<kind> <XY> ..." with the path as the last space-separated
+            # field (paths may contain spaces, so split a fixed count)
+            fields = {'1': 8, '2': 9, 'u': 10}[kind]
+            xy, path = record[2:4], record.split(' ', fields)[fields]
+            if kind == '2':
+                next(records, None)  # Original path of a rename/copy
+            if xy[0] != '.':
+                staged.append(path)
+            if xy[1] != '.':
+                modified.append(path)
+    
+    return staged, modified, untracked
+
+
+# Files above this size are cloned in-kernel with copy_file_range
+_COPY_FILE_RANGE_THRESHOLD = 1024 * 1024
+
+
+def _copy_file(source, dest):
+    """shutil.copy2, using os.copy_file_range for large files on Linux."""
+    import shutil
+    
+    # Opening dest for writing would truncate the source when both are the
+    # same file (directly or via a link); copy2 raises SameFileError instead
+    if os.path.exists(dest) and os.path.samefile(source, dest):
+        return shutil.copy2(source, dest)
+    
+    size = os.stat(source).st_size
+    if size > _COPY_FILE_RANGE_THRESHOLD and hasattr(os, "copy_file_range"):
+        try:
+            # In-kernel copy; on btrfs/XFS this can be a reflink
+            with open(source, "rb") as src, open(dest, "wb") as dst:
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(source, dest)
+                return dest
+        except OSError:
+            pass  # e.g. EXDEV/ENOSYS on older kernels; use the generic path
+    
+    return shutil.copy2(source, dest)
 
 
 def copy_files_to_repo(
@@ -145,18 +184,19 @@ def copy_files_to_repo(
     for source in source_files:
         if source.is_file():
             dest = target_dir / source.name
-            shutil.copy2(source, dest)
+            _copy_file(source, dest)
             rel_path = str(dest.relative_to(target_repo))
             copied.append(rel_path)
         elif source.is_dir():
             dest = target_dir / source.name
             if dest.exists():
                 shutil.rmtree(dest)
-            shutil.copytree(source, dest)
-            # Add all files in directory
-            for f in dest.rglob("*"):
-                if f.is_file():
-                    copied.append(str(f.relative_to(target_repo)))
+            shutil.copytree(source, dest, copy_function=_copy_file)
+            # Add all files in directory; os.walk keeps scandir's file/dir
+            # split, so entries are not stat'ed again
+            for root, _dirs, filenames in os.walk(dest):
+                root_rel = os.path.relpath(root, target_repo)
+                copied.extend(os.path.join(root_rel, fn) for fn in filenames)
     
     return copied
 
@@ -171,20 +211,25 @@ def git_add_commit_push(
     """
     Stage, commit, and optionally push files.
     """
-    original_dir = os.getcwd()
-    
+    # Every git call runs with cwd=repo_path instead of chdir'ing the
+    # process, so publishes to different repos can run concurrently
     try:
-        os.chdir(repo_path)
-        
-        # Stage files
-        for f in files:
-            subprocess.run(["git", "add", f], check=True, capture_output=True)
+        # Stage files with one git process; paths go over stdin NUL-separated
+        # so long file lists cannot hit ARG_MAX
+        subprocess.run(
+            ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+            input=b"\0".join(f.encode('utf-8') for f in files),
+            check=True,
+            capture_output=True,
+            cwd=repo_path
+        )
         
         # Commit
         result = subprocess.run(
             ["git", "commit", "-m", commit_message],
             capture_output=True,
-            text=True
+            text=True,
+            cwd=repo_path
         )
         
         if result.returncode != 0:
@@ -209,7 +254,8 @@ def git_add_commit_push(
         # Get commit hash
         commit_hash = subprocess.check_output(
             ["git", "rev-parse", "HEAD"],
-            text=True
+            text=True,
+            cwd=repo_path
         ).strip()[:7]
         
         # Push if requested
@@ -217,7 +263,8 @@ def git_add_commit_push(
             push_result = subprocess.run(
                 ["git", "push", "origin", branch],
                 capture_output=True,
-                text=True
+                text=True,
+                cwd=repo_path
             )
             if push_result.returncode != 0:
                 return PublishResult(
@@ -247,8 +294,6 @@ def git_add_commit_push(
             commit_hash=None,
             error=str(e)
         )
-    finally:
-        os.chdir(original_dir)
 
 
 def publish_to_github(
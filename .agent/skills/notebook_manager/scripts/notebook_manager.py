@@ -5,44 +5,17 @@ Create and manage Jupyter notebooks with templates
 """
 
 import json
-import nbformat as nbf
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 
+if TYPE_CHECKING:  # nbformat is imported lazily at runtime (see _get_nbf)
+    import nbformat as nbf
 
-class NotebookManager:
-    """Manage Jupyter notebooks with templates"""
-    
-    def __init__(self, templates_dir='templates'):
-        self.templates_dir = Path(__file__).parent.parent / templates_dir
-        self.nb_version = 4  # Jupyter notebook format version
-    
-    def create_cell(self, cell_type: str, source: str, metadata: Dict = None) -> nbf.NotebookNode:
-        """Create a notebook cell"""
-        if cell_type == 'markdown':
-            cell = nbf.v4.new_markdown_cell(source)
-        elif cell_type == 'code':
-            cell = nbf.v4.new_code_cell(source)
-        else:
-            raise ValueError(f"Invalid cell type: {cell_type}")
-        
-        if metadata:
-            cell.metadata.update(metadata)
-        
-        return cell
-    
-    def create_data_exploration_notebook(self, title: str, dataset_name: str = "dataset") -> nbf.NotebookNode:
-        """Create a data exploration notebook"""
-        
-        cells = []
-        
-        # Title
-        cells.append(self.create_cell('markdown', f"# Data Exploration: {title}\\n\\n**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\\n\\n## Objective\\n\\nExplore and analyze {dataset_name} to understand its structure, quality, and characteristics."))
-        
-        # Imports
-        cells.append(self.create_cell('markdown', "## 1. Setup & Imports"))
-        cells.append(self.create_cell('code', """import pandas as pd
+# Static template cells (cell_type, source); only the title and dataset/app cells vary per call
+_EXPLORATION_SETUP_CELLS = (
+    ('markdown', "## 1. Setup & Imports"),
+    ('code', """import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -58,37 +31,23 @@ warnings.filterwarnings('ignore')
 sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (12, 6)
 
-print("✓ Imports complete")"""))
-        
-        # Load Data
-        cells.append(self.create_cell('markdown', "## 2. Load Data"))
-        cells.append(self.create_cell('code', f"""# Load dataset
-# TODO: Update path to your data file
-file_path = 'data/{dataset_name}.csv'
+print("✓ Imports complete")"""),
+    ('markdown', "## 2. Load Data"),
+)
 
-try:
-    df = pd.read_csv(file_path)
-    print(f"✓ Loaded {{len(df):,}} rows and {{len(df.columns)}} columns")
-except FileNotFoundError:
-    print(f"✗ File not found: {{file_path}}")
-    df = None"""))
-        
-        # Overview
-        cells.append(self.create_cell('markdown', "## 3. Dataset Overview"))
-        cells.append(self.create_cell('code', """# Display first few rows
-df.head()"""))
-        
-        cells.append(self.create_cell('code', """# Dataset info
+_EXPLORATION_ANALYSIS_CELLS = (
+    ('markdown', "## 3. Dataset Overview"),
+    ('code', """# Display first few rows
+df.head()"""),
+    ('code', """# Dataset info
 print("Dataset Information:")
 print("-" * 50)
 print(f"Shape: {df.shape}")
 print(f"Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
 print("\\nColumn Types:")
-print(df.dtypes.value_counts())"""))
-        
-        # Missing Values
-        cells.append(self.create_cell('markdown', "## 4. Data Quality Checks"))
-        cells.append(self.create_cell('code', """# Check for missing values
+print(df.dtypes.value_counts())"""),
+    ('markdown', "## 4. Data Quality Checks"),
+    ('code', """# Check for missing values
 missing = df.isnull().sum()
 missing_pct = (missing / len(df)) * 100
 
@@ -98,18 +57,14 @@ missing_df = pd.DataFrame({
 }).sort_values('Percentage', ascending=False)
 
 print("Missing Values:")
-print(missing_df[missing_df['Missing Count'] > 0])"""))
-        
-        cells.append(self.create_cell('code', """# Check for duplicates
+print(missing_df[missing_df['Missing Count'] > 0])"""),
+    ('code', """# Check for duplicates
 duplicates = df.duplicated().sum()
-print(f"Duplicate rows: {duplicates:,} ({(duplicates/len(df)*100):.2f}%)")"""))
-        
-        # Statistics
-        cells.append(self.create_cell('markdown', "## 5. Statistical Summary"))
-        cells.append(self.create_cell('code', """# Numerical columns summary
-df.describe()"""))
-        
-        cells.append(self.create_cell('code', """# Categorical columns summary
+print(f"Duplicate rows: {duplicates:,} ({(duplicates/len(df)*100):.2f}%)")"""),
+    ('markdown', "## 5. Statistical Summary"),
+    ('code', """# Numerical columns summary
+df.describe()"""),
+    ('code', """# Categorical columns summary
 categorical_cols = df.select_dtypes(include=['object']).columns
 if len(categorical_cols) > 0:
     print("Categorical Columns:")
@@ -118,11 +73,9 @@ if len(categorical_cols) > 0:
         print(f"\\n{col}:")
         print(f"  Unique values: {unique_count}")
         if unique_count < 20:
-            print(f"  Value counts:\\n{df[col].value_counts().head(10)}")"""))
-        
-        # Visualizations
-        cells.append(self.create_cell('markdown', "## 6. Visualizations"))
-        cells.append(self.create_cell('code', """# Distribution of numerical columns
+            print(f"  Value counts:\\n{df[col].value_counts().head(10)}")"""),
+    ('markdown', "## 6. Visualizations"),
+    ('code', """# Distribution of numerical columns
 numerical_cols = df.select_dtypes(include=[np.number]).columns
 
 if len(numerical_cols) > 0:
@@ -145,9 +98,8 @@ if len(numerical_cols) > 0:
         axes[idx].axis('off')
     
     plt.tight_layout()
-    plt.show()"""))
-        
-        cells.append(self.create_cell('code', """# Correlation heatmap
+    plt.show()"""),
+    ('code', """# Correlation heatmap
 if len(numerical_cols) > 1:
     plt.figure(figsize=(12, 8))
     correlation = df[numerical_cols].corr()
@@ -155,13 +107,140 @@ if len(numerical_cols) > 1:
                 square=True, linewidths=1, cbar_kws={"shrink": 0.8})
     plt.title('Correlation Heatmap')
     plt.tight_layout()
-    plt.show()"""))
+    plt.show()"""),
+    ('markdown', """## 7. Key Insights\\n\\n### Observations\\n- TODO: Add your observations\\n\\n### Data Quality Issues\\n- TODO: Note any data quality problems\\n\\n### Next Steps\\n- TODO: List next steps for analysis"""),
+)
+
+_SPARK_SETUP_CELLS = (
+    ('markdown', "## 1. Spark Session Setup"),
+)
+
+_SPARK_PIPELINE_CELLS = (
+    ('markdown', "## 2. Load Data"),
+    ('code', """# Load source data
+source_path = "path/to/data"  # TODO: Update path
+
+df = spark.read \\
+    .format("parquet") \\
+    .load(source_path)
+
+print(f"✓ Loaded {df.count():,} records")
+df.printSchema()"""),
+    ('markdown', "## 3. Data Exploration"),
+    ('code', """# Show sample data
+df.show(10, truncate=False)"""),
+    ('markdown', "## 4. Transformations"),
+    ('code', """# Apply transformations
+df_transformed = df \\
+    .withColumn("processing_date", F.current_date()) \\
+    .withColumn("processing_timestamp", F.current_timestamp())
+
+# TODO: Add your transformation logic here
+
+df_transformed.show(5)"""),
+    ('markdown', "## 5. Data Quality Checks"),
+    ('code', """# Check null counts
+null_counts = df_transformed.select(
+    [F.count(F.when(F.col(c).isNull(), c)).alias(c) for c in df_transformed.columns]
+)
+
+print("Null counts:")
+null_counts.show()"""),
+    ('markdown', "## 6. Save Results"),
+    ('code', """# Write to target
+target_path = "path/to/output"  # TODO: Update path
+
+# df_transformed.write \\
+#     .mode("overwrite") \\
+#     .format("parquet") \\
+#     .partitionBy("processing_date") \\
+#     .save(target_path)
+
+print(f"✓ Data would be written to {target_path}")"""),
+    ('markdown', "## 7. Cleanup"),
+    ('code', """# Stop Spark session
+# spark.stop()
+print("Spark session still running for development")"""),
+)
+
+
+def _notebook_json(notebook) -> str:
+    """Serialize a notebook exactly as nbf.write lays it out on disk"""
+    # nbformat stores cell sources as lists of lines, indented by 1, keys sorted
+    cells = [
+        {**cell, 'source': cell['source'].splitlines(True)}
+        if isinstance(cell.get('source'), str) else cell
+        for cell in notebook['cells']
+    ]
+    return json.dumps({**notebook, 'cells': cells}, indent=1, sort_keys=True,
+                      separators=(',', ': '), ensure_ascii=False) + "\n"
+
+
+# nbformat is slow to import; loaded on first use by _get_nbf
+_nbf = None
+
+
+def _get_nbf():
+    """Import nbformat once and cache the module."""
+    global _nbf
+    if _nbf is None:
+        import nbformat
+        _nbf = nbformat
+    return _nbf
+
+
+class NotebookManager:
+    """Manage Jupyter notebooks with templates"""
+    
+    def __init__(self, templates_dir='templates'):
+        self.templates_dir = Path(__file__).parent.parent / templates_dir
+        self.nb_version = 4  # Jupyter notebook format version
+    
+    def create_cell(self, cell_type: str, source: str, metadata: Dict = None) -> "nbf.NotebookNode":
+        """Create a notebook cell"""
+        nbf = _get_nbf()
+        if cell_type == 'markdown':
+            cell = nbf.v4.new_markdown_cell(source)
+        elif cell_type == 'code':
+            cell = nbf.v4.new_code_cell(source)
+        else:
+            raise ValueError(f"Invalid cell type: {cell_type}")
+        
+        if metadata:
+            cell.metadata.update(metadata)
+        
+        return cell
+    
+    def create_data_exploration_notebook(self, title: str, dataset_name: str = "dataset",
+                                         created: Optional[datetime] = None) -> "nbf.NotebookNode":
+        """Create a data exploration notebook"""
+        
+        cells = []
+        created_str = (created or datetime.now()).strftime('%Y-%m-%d %H:%M')
+        
+        # Title
+        cells.append(self.create_cell('markdown', f"# Data Exploration: {title}\\n\\n**Created:** {created_str}\\n\\n## Objective\\n\\nExplore and analyze {dataset_name} to understand its structure, quality, and characteristics."))
+        
+        # Imports
+        cells.extend(self.create_cell(kind, source) for kind, source in _EXPLORATION_SETUP_CELLS)
+        
+        # Load Data
+        cells.append(self.create_cell('code', f"""# Load dataset
+# TODO: Update path to your data file
+file_path = 'data/{dataset_name}.csv'
+
+try:
+    df = pd.read_csv(file_path)
+    print(f"✓ Loaded {{len(df):,}} rows and {{len(df.columns)}} columns")
+except FileNotFoundError:
+    print(f"✗ File not found: {{file_path}}")
+    df = None"""))
         
-        # Insights
-        cells.append(self.create_cell('markdown', "## 7. Key Insights\\n\\n### Observations\\n- TODO: Add your observations\\n\\n### Data Quality Issues\\n- TODO: Note any data quality problems\\n\\n### Next Steps\\n- TODO: List next steps for analysis"))
+        # Overview, quality checks, statistics, visualizations and insights
+        cells.extend(self.create_cell(kind, source) for kind, source in _EXPLORATION_ANALYSIS_CELLS)
         
         # Create notebook
-        nb = nbf.v4.new_notebook(cells=cells)
+        nb = _get_nbf().v4.new_notebook(cells=cells)
         
         # Add metadata
         nb.metadata = {
@@ -178,16 +257,18 @@ if len(numerical_cols) > 1:
         
         return nb
     
-    def create_spark_notebook(self, title: str, app_name: str = "spark_app") -> nbf.NotebookNode:
+    def create_spark_notebook(self, title: str, app_name: str = "spark_app",
+                              created: Optional[datetime] = None) -> "nbf.NotebookNode":
         """Create a Spark development notebook"""
         
         cells = []
+        created_str = (created or datetime.now()).strftime('%Y-%m-%d %H:%M')
         
         # Title
-        cells.append(self.create_cell('markdown', f"# Spark Job Development: {title}\\n\\n**Created:** {datetime.now().strftime('%Y-%m-%d %H:%M')}"))
+        cells.append(self.create_cell('markdown', f"# Spark Job Development: {title}\\n\\n**Created:** {created_str}"))
         
         # Setup
-        cells.append(self.create_cell('markdown', "## 1. Spark Session Setup"))
+        cells.extend(self.create_cell(kind, source) for kind, source in _SPARK_SETUP_CELLS)
         cells.append(self.create_cell('code', f"""from pyspark.sql import SparkSession
 from pyspark.sql import functions as F
 from pyspark.sql.types import *
@@ -210,64 +291,11 @@ spark.sparkContext.setLogLevel("WARN")
 print(f"✓ Spark {{spark.version}} session created")
 print(f"✓ Application: {app_name}")"""))
         
-        # Load Data
-        cells.append(self.create_cell('markdown', "## 2. Load Data"))
-        cells.append(self.create_cell('code', """# Load source data
-source_path = "path/to/data"  # TODO: Update path
-
-df = spark.read \\
-    .format("parquet") \\
-    .load(source_path)
-
-print(f"✓ Loaded {df.count():,} records")
-df.printSchema()"""))
-        
-        # Explore
-        cells.append(self.create_cell('markdown', "## 3. Data Exploration"))
-        cells.append(self.create_cell('code', """# Show sample data
-df.show(10, truncate=False)"""))
-        
-        # Transform
-        cells.append(self.create_cell('markdown', "## 4. Transformations"))
-        cells.append(self.create_cell('code', """# Apply transformations
-df_transformed = df \\
-    .withColumn("processing_date", F.current_date()) \\
-    .withColumn("processing_timestamp", F.current_timestamp())
-
-# TODO: Add your transformation logic here
-
-df_transformed.show(5)"""))
-        
-        # Data Quality
-        cells.append(self.create_cell('markdown', "## 5. Data Quality Checks"))
-        cells.append(self.create_cell('code', """# Check null counts
-null_counts = df_transformed.select(
-    [F.count(F.when(F.col(c).isNull(), c)).alias(c) for c in df_transformed.columns]
-)
-
-print("Null counts:")
-null_counts.show()"""))
-        
-        # Save
-        cells.append(self.create_cell('markdown', "## 6. Save Results"))
-        cells.append(self.create_cell('code', """# Write to target
-target_path = "path/to/output"  # TODO: Update path
-
-# df_transformed.write \\
-#     .mode("overwrite") \\
-#     .format("parquet") \\
-#     .partitionBy("processing_date") \\
-#     .save(target_path)
-
-print(f"✓ Data would be written to {target_path}")"""))
-        
-        cells.append(self.create_cell('markdown', "## 7. Cleanup"))
-        cells.append(self.create_cell('code', """# Stop Spark session
-# spark.stop()
-print("Spark session still running for development")"""))
+        # Load, explore, transform, check, save and cleanup
+        cells.extend(self.create_cell(kind, source) for kind, source in _SPARK_PIPELINE_CELLS)
         
         # Create notebook
-        nb = nbf.v4.new_notebook(cells=cells)
+        nb = _get_nbf().v4.new_notebook(cells=cells)
         nb.metadata = {
             'kernelspec': {
                 'display_name': 'Python 3',
@@ -278,15 +306,20 @@ print("Spark session still running for development")"""))
         
         return nb
     
-    def save_notebook(self, notebook: nbf.NotebookNode, filename: str, output_dir: str = "."):
-        """Save notebook to file"""
+    def save_notebook(self, notebook: "nbf.NotebookNode", filename: str, output_dir: str = ".",
+                      validate: bool = False):
+        """Save notebook to file (validate=True routes through nbformat's validator)"""
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         filepath = output_path / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            nbf.write(notebook, f)
+        if validate:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                _get_nbf().write(notebook, f)
+        else:
+            # Templates are built with nbf.v4 constructors, so skip re-validation
+            filepath.write_text(_notebook_json(notebook), encoding='utf-8')
         
         print(f"✓ Notebook saved: {filepath}")
         return filepath
@@ -302,22 +335,27 @@ if __name__ == "__main__":
     parser.add_argument("--title", required=True, help="Notebook title")
     parser.add_argument("--output", default=".", help="Output directory")
     parser.add_argument("--filename", help="Output filename (auto-generated if not provided)")
+    parser.add_argument("--validate", action="store_true",
+                       help="Validate and write via nbformat instead of the fast direct path")
     
     args = parser.parse_args()
     
     nm = NotebookManager()
     
+    # One timestamp for both the filename and the notebook header
+    now = datetime.now()
+    
     # Generate filename if not provided
     if not args.filename:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        timestamp = now.strftime("%Y%m%d_%H%M")
         safe_title = args.title.lower().replace(' ', '_')
         args.filename = f"{timestamp}_{safe_title}.ipynb"
     
     # Create notebook
     if args.template == 'exploration':
-        nb = nm.create_data_exploration_notebook(args.title)
+        nb = nm.create_data_exploration_notebook(args.title, created=now)
     elif args.template == 'spark':
-        nb = nm.create_spark_notebook(args.title)
+        nb = nm.create_spark_notebook(args.title, created=now)
     
     # Save
-    nm.save_notebook(nb, args.filename, args.output)
+    nm.save_notebook(nb, args.filename, args.output, validate=args.validate)
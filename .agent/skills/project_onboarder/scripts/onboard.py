@@ -7,8 +7,12 @@ Usage:
     python onboard.py [--name "project-name"] [--description "Description"] [--dry-run]
 """
 
+import os
 import sys
 import argparse
+import re
+import shlex
+import shutil
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -22,6 +26,17 @@ sys.path.insert(0, str(agent_root / 'core'))
 from linear_client import LinearClient
 from obsidian_client import create_note, get_vault_path
 
+# Placeholders filled in Templates/project-template.md
+_PLACEHOLDER_RE = re.compile(r'\{(PROJECT_NAME|DESCRIPTION|LINEAR_ID|LINEAR_URL|LOCA_PATH|GIT_PATH|DATE)\}')
+
+PROJECT_FOLDERS = ('src', 'docs', 'notebooks')
+
+GIT_BOOTSTRAP_STEPS = (
+    ['git', 'init', '-q'],
+    ['git', 'add', '.'],
+    ['git', 'commit', '-q', '-m', ':tada: Initial commit'],
+)
+
 class ProjectOnboarder:
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
@@ -34,16 +49,14 @@ class ProjectOnboarder:
         """Create project directory structure"""
         project_path = self.projects_root / project_name
         
-        folders = ['src', 'docs', 'notebooks']
-        
         print(f"📂 Creating folders in {project_path}...")
         
         if self.dry_run:
             return project_path
 
-        project_path.mkdir(parents=True, exist_ok=True)
-        for folder in folders:
-            (project_path / folder).mkdir(exist_ok=True)
+        # makedirs creates project_path along with the first leaf
+        for folder in PROJECT_FOLDERS:
+            os.makedirs(project_path / folder, exist_ok=True)
             
         return project_path
 
@@ -54,9 +67,6 @@ class ProjectOnboarder:
         if self.dry_run:
             return
 
-        # git init
-        subprocess.run(['git', 'init'], cwd=project_path, check=True, capture_output=True)
-        
         # .gitignore
         gitignore = """
 __pycache__/
@@ -66,15 +76,21 @@ __pycache__/
 node_modules/
 .DS_Store
 """
-        (project_path / '.gitignore').write_text(gitignore.strip())
+        (project_path / '.gitignore').write_bytes(gitignore.strip().encode('utf-8'))
         
         # README.md
         readme = f"# {project_path.name}\n\n{description}\n"
-        (project_path / 'README.md').write_text(readme)
+        (project_path / 'README.md').write_bytes(readme.encode('utf-8'))
         
-        # Initial commit
-        subprocess.run(['git', 'add', '.'], cwd=project_path, check=True, capture_output=True)
-        subprocess.run(['git', 'commit', '-m', ':tada: Initial commit'], cwd=project_path, check=True, capture_output=True)
+        # git init + initial commit in a single process spawn where a POSIX shell exists
+        if shutil.which('sh'):
+            script = ' && '.join(shlex.join(step) for step in GIT_BOOTSTRAP_STEPS)
+            subprocess.run(['sh', '-c', script], cwd=project_path, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        else:
+            for step in GIT_BOOTSTRAP_STEPS:
+                subprocess.run(step, cwd=project_path, check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
     def create_linear_project(self, name: str, description: str) -> Optional[str]:
         """Create Linear project and return ID"""
@@ -120,14 +136,17 @@ node_modules/
         template_path = self.vault_path / "Templates" / "project-template.md"
         if template_path.exists():
             content = template_path.read_text(encoding='utf-8')
-            # Replace placeholders
-            content = content.replace("{PROJECT_NAME}", name.replace("-", " ").title())
-            content = content.replace("{DESCRIPTION}", description)
-            content = content.replace("{LINEAR_ID}", linear_id or "N/A")
-            content = content.replace("{LINEAR_URL}", linear_link)
-            content = content.replace("{LOCA_PATH}", relative_path)
-            content = content.replace("{GIT_PATH}", relative_path)
-            content = content.replace("{DATE}", datetime.now().strftime("%Y-%m-%d"))
+            # Replace placeholders in a single pass
+            subs = {
+                "PROJECT_NAME": name.replace("-", " ").title(),
+                "DESCRIPTION": description,
+                "LINEAR_ID": linear_id or "N/A",
+                "LINEAR_URL": linear_link,
+                "LOCA_PATH": relative_path,
+                "GIT_PATH": relative_path,
+                "DATE": frontmatter["created"],
+            }
+            content = _PLACEHOLDER_RE.sub(lambda m: subs[m.group(1)], content)
         else:
             # Fallback if template missing
             content = f"""
@@ -10,25 +10,40 @@ Provides automated "Learning-in-Public" workflow:
 - weekly_summary: Aggregate weekly stats
 """
 
-from .collect_context import get_config, get_git_info, get_linear_tickets, get_obsidian_focus
-from .publish_detector import analyze_session, PublishDecision, ContentType, TargetRepo
-from .linear_client import LinearClient, LinearIssue
-from .synthesizer import synthesize_session, SynthesizedContent
-from .weekly_summary import generate_weekly_summary, WeeklySummary
-
-__all__ = [
-    'get_config',
-    'get_git_info', 
-    'get_linear_tickets',
-    'get_obsidian_focus',
-    'analyze_session',
-    'PublishDecision',
-    'ContentType',
-    'TargetRepo',
-    'LinearClient',
-    'LinearIssue',
-    'synthesize_session',
-    'SynthesizedContent',
-    'generate_weekly_summary',
-    'WeeklySummary'
-]
+import importlib
+
+# Public name -> submodule. Submodules are imported on first attribute access
+# (PEP 562) so importing the package does not load requests, Linear, etc.
+_EXPORTS = {
+    'get_config': 'collect_context',
+    'get_git_info': 'collect_context',
+    'get_linear_tickets': 'collect_context',
+    'get_obsidian_focus': 'collect_context',
+    'gather_context': 'collect_context',
+    'analyze_session': 'publish_detector',
+    'PublishDecision': 'publish_detector',
+    'ContentType': 'publish_detector',
+    'TargetRepo': 'publish_detector',
+    'LinearClient': 'linear_client',
+    'LinearIssue': 'linear_client',
+    'synthesize_session': 'synthesizer',
+    'SynthesizedContent': 'synthesizer',
+    'generate_weekly_summary': 'weekly_summary',
+    'WeeklySummary': 'weekly_summary',
+}
+
+__all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
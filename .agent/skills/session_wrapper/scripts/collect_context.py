@@ -1,37 +1,92 @@
 import os
-import json
+import sys
+import heapq
 import subprocess
-import requests
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Shared helpers live in .agent/core; appended so sibling modules such as
+# linear_client.py still take precedence over core's
+sys.path.append(str(Path(__file__).parent.parent.parent.parent / 'core'))
+
+from jsonio import dumps_pretty, loads as _json_loads
+
 # Configuration Paths
 MCP_CONFIG_PATH = Path(".agent/config/mcp_config.json")
+# Vault-relative note that, when present, short-circuits the recent-notes scan
+DEFAULT_FOCUS_NOTE = "System/Focus.md"
+# Vault folders never descended into when looking for recent notes
+VAULT_SKIP_DIRS = frozenset({".git", ".trash", "node_modules"})
+# Characters of each note included as its preview
+PREVIEW_CHARS = 500
+
+# Query for In Progress tickets, recently done, AND Active Cycle tickets
+_LINEAR_QUERY = """
+query SessionTickets($since: DateTime!) {
+  issues(filter: { 
+    or: [
+      { state: { name: { eq: "In Progress" } } },
+      { completedAt: { gt: $since } }
+    ]
+  }) {
+    nodes {
+      identifier
+      title
+      url
+      description
+      state { name }
+      project { name }
+      cycle { number }
+    }
+  }
+}
+"""
+
+# Shared keep-alive session so repeated Linear queries reuse the TLS connection;
+# created by _get_session so importing this module does not load requests
+_SESSION = None
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _SESSION
 
 def get_config():
     if MCP_CONFIG_PATH.exists():
         try:
-            with open(MCP_CONFIG_PATH, 'r') as f:
-                return json.load(f)
+            with open(MCP_CONFIG_PATH, 'rb') as f:
+                return _json_loads(f.read())
         except:
             return {}
     return {}
 
 def get_git_info():
     try:
-        # Get changed files
-        diff = subprocess.check_output(["git", "diff", "--stat"], stderr=subprocess.STDOUT).decode('utf-8')
-        # Get recent commits (last 24 hours to be safe)
-        log = subprocess.check_output(["git", "log", "--since=24.hours", "--oneline"], stderr=subprocess.STDOUT).decode('utf-8')
-        
+        # Get changed files, parsing --stat lines as git emits them
         # Extract list of modified files for publish detection
+        diff_lines = []
         modified_files = []
-        for line in diff.split('\n'):
-            # Match lines like: " path/to/file.py | 10 +++---"
-            import re
-            match = re.match(r'^\s*(.+?)\s*\|', line)
-            if match:
-                modified_files.append(match.group(1).strip())
+        cmd = ["git", "diff", "--stat"]
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              encoding='utf-8') as proc:
+            for line in proc.stdout:
+                diff_lines.append(line)
+                # Split lines like: " path/to/file.py | 10 +++---"
+                name, sep, _ = line.partition('|')
+                name = name.strip()
+                if sep and name:
+                    modified_files.append(name)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        diff = "".join(diff_lines)
+        
+        # Get recent commits (last 24 hours to be safe)
+        log = subprocess.check_output(["git", "log", "--since=24.hours", "--oneline"], stderr=subprocess.STDOUT).decode('utf-8')
         
         return {
             "diff_stat": diff.strip(),
@@ -44,7 +99,7 @@ def get_git_info():
     except FileNotFoundError:
         return {"error": "Git not installed", "modified_files": [], "file_count": 0}
 
-def get_linear_tickets(config):
+def get_linear_tickets(config, now=None):
     api_key = config.get("linear", {}).get("api_key")
     if not api_key:
         return {"tickets": [], "error": "No Linear API key found in config"}
@@ -55,30 +110,15 @@ def get_linear_tickets(config):
         "Authorization": api_key
     }
     
-    # Query for In Progress tickets, recently done, AND Active Cycle tickets
-    query = """
-    query {
-      issues(filter: { 
-        or: [
-          { state: { name: { eq: "In Progress" } } },
-          { completedAt: { gt: "%s" } }
-        ]
-      }) {
-        nodes {
-          identifier
-          title
-          url
-          description
-          state { name }
-          project { name }
-          cycle { number }
-        }
-      }
-    }
-    """ % (datetime.datetime.now() - datetime.timedelta(hours=24)).isoformat()
+    # Only the cutoff varies; the query text stays constant so Linear can cache it
+    now = now or datetime.datetime.now()
+    since = now.astimezone(datetime.timezone.utc) - datetime.timedelta(hours=24)
+    variables = {"since": since.strftime("%Y-%m-%dT%H:%M:%S.%fZ")}
 
     try:
-        response = requests.post(url, headers=headers, json={"query": query})
+        session = _get_session()
+        session.headers.update(headers)
+        response = session.post(url, json={"query": _LINEAR_QUERY, "variables": variables}, timeout=10)
         if response.status_code == 200:
             data = response.json()
             return {"tickets": data.get("data", {}).get("issues", {}).get("nodes", [])}
@@ -87,60 +127,95 @@ def get_linear_tickets(config):
     except Exception as e:
         return {"error": str(e)}
 
+def _iter_note_mtimes(directory):
+    """Yield (path, mtime) for every .md note, pruning .obsidian and VAULT_SKIP_DIRS."""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in VAULT_SKIP_DIRS and not entry.name.startswith(".obsidian"):
+                yield from _iter_note_mtimes(entry.path)
+        elif entry.name.endswith(".md"):
+            try:
+                # DirEntry caches the stat, unlike os.path.getmtime
+                yield entry.path, entry.stat().st_mtime
+            except OSError:
+                continue
+
+def _read_preview(path, chars=PREVIEW_CHARS):
+    """Return the first `chars` characters of a note via one unbuffered read."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # UTF-8 is at most 4 bytes per char, so this always covers `chars`
+        raw = os.read(fd, chars * 4)
+    finally:
+        os.close(fd)
+    return raw.decode("utf-8", errors="replace").replace("\r\n", "\n")[:chars]
+
 def get_obsidian_focus(config):
     vault_path = config.get("obsidian", {}).get("vault_path")
     if not vault_path or not os.path.exists(vault_path):
         return {"error": "Obsidian vault path not found"}
     
     # Check for a specific 'Current Focus' note or recently modified
-    # 1. Try to read a standard 'System/Focus.md' or similar if it existed
-    # 2. For now, let's just return the last modified non-daily note
+    # 1. Read the standard 'System/Focus.md' (or obsidian.focus_note) if it exists
+    # 2. Otherwise return the last modified notes from a vault scan
+    focus_note = config.get("obsidian", {}).get("focus_note", DEFAULT_FOCUS_NOTE)
+    focus_path = Path(vault_path) / focus_note
+    if focus_path.is_file():
+        try:
+            return {"recent_notes": [{"path": str(focus_path), "preview": _read_preview(focus_path)}]}
+        except OSError:
+            pass # Fall back to the vault scan
     
     try:
-        # Find all .md files, sort by modification time
-        files = []
-        for root, _, filenames in os.walk(vault_path):
-            if ".obsidian" in root: continue
-            for f in filenames:
-                if f.endswith(".md"):
-                    full_path = os.path.join(root, f)
-                    files.append((full_path, os.path.getmtime(full_path)))
-        
-        # Sort by time desc
-        files.sort(key=lambda x: x[1], reverse=True)
+        # Get top 3 recently modified .md files without sorting the vault
+        newest = heapq.nlargest(3, _iter_note_mtimes(vault_path), key=lambda x: x[1])
         
-        # Get top 3 recently modified
         recent_notes = []
-        for fpath, _ in files[:3]:
+        for fpath, _ in newest:
             try:
-                with open(fpath, "r", encoding="utf-8") as f:
-                    content = f.read(500) # First 500 chars
                 recent_notes.append({
                     "path": fpath,
-                    "preview": content
+                    "preview": _read_preview(fpath)
                 })
-            except:
+            except OSError:
                 continue
                 
         return {"recent_notes": recent_notes}
     except Exception as e:
         return {"error": str(e)}
 
+def gather_context(config, now):
+    """Collect (git, linear, obsidian) data concurrently."""
+    # Git, Linear and the vault are independent I/O; overlap them
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        git_future = executor.submit(get_git_info)
+        linear_future = executor.submit(get_linear_tickets, config, now)
+        obsidian_future = executor.submit(get_obsidian_focus, config)
+        return git_future.result(), linear_future.result(), obsidian_future.result()
+
 def main():
+    now = datetime.datetime.now()
     config = get_config()
-    git_data = get_git_info()
-    linear_data = get_linear_tickets(config)
-    obsidian_data = get_obsidian_focus(config)
+    git_data, linear_data, obsidian_data = gather_context(config, now)
     
     context = {
-        "timestamp": datetime.datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "git": git_data,
         "linear": linear_data,
         "obsidian": obsidian_data,
         "obsidian_vault_path": config.get("obsidian", {}).get("vault_path")
     }
     
-    print(json.dumps(context, indent=2))
+    # Emit UTF-8 whatever the console encoding, since non-ASCII is not escaped
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dumps_pretty(context).encode('utf-8') + b"\n")
+    sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
     main()
@@ -28,6 +28,9 @@ class TargetRepo(Enum):
     LEARNING_LOGS = "learning-logs"
 
 
+_TARGET_REPO_BY_VALUE = {r.value: r for r in TargetRepo}
+
+
 @dataclass
 class PublishDecision:
     should_publish: bool
@@ -42,14 +45,29 @@ SKILL_INDICATORS = ["skill.md", "skills/", "__init__.py", "scripts/"]
 HOMEWORK_INDICATORS = ["homework", "exercise", "solution", "answer", "submission"]
 DE_ZOOMCAMP_INDICATORS = ["zoomcamp", "module-", "bigquery", "spark", "dbt", "terraform", "docker", "airflow"]
 SIDE_QUEST_KEYWORDS = ["config", "setup", "tool", "automation", "script", "util"]
+META_FILE_INDICATORS = [".gitignore", "readme", "license", ".env"]
+
+# Matches diff --stat lines like: " path/to/file.py | 10 +++---"
+_DIFF_STAT_RE = re.compile(r'^\s*(.+?)\s*\|')
+# Separators used to split ticket titles into keywords
+_TITLE_SPLIT_RE = re.compile(r'[\s\-_:,]+')
+
+
+def _substring_re(indicators: List[str]) -> "re.Pattern":
+    """One alternation regex equivalent to `any(i in text for i in indicators)`."""
+    return re.compile("|".join(map(re.escape, indicators)))
+
+
+_HOMEWORK_RE = _substring_re(HOMEWORK_INDICATORS)
+_DE_ZOOMCAMP_RE = _substring_re(DE_ZOOMCAMP_INDICATORS)
+_META_FILE_RE = _substring_re(META_FILE_INDICATORS)
 
 
 def extract_modified_files(git_diff_stat: str) -> List[str]:
     """Extract list of modified files from git diff --stat output."""
     files = []
-    for line in git_diff_stat.split('\n'):
-        # Match lines like: " path/to/file.py | 10 +++---"
-        match = re.match(r'^\s*(.+?)\s*\|', line)
+    for line in git_diff_stat.splitlines():
+        match = _DIFF_STAT_RE.match(line)
         if match:
             files.append(match.group(1).strip())
     return files
@@ -57,7 +75,7 @@ def extract_modified_files(git_diff_stat: str) -> List[str]:
 
 def count_modified_files(git_diff_stat: str) -> int:
     """Count number of files modified from git diff --stat output."""
-    return len(extract_modified_files(git_diff_stat))
+    return sum(1 for line in git_diff_stat.splitlines() if _DIFF_STAT_RE.match(line))
 
 
 def extract_ticket_keywords(tickets: List[Dict]) -> List[str]:
@@ -66,64 +84,89 @@ def extract_ticket_keywords(tickets: List[Dict]) -> List[str]:
     for ticket in tickets:
         title = ticket.get("title", "").lower()
         # Split on common separators and filter short words
-        words = re.split(r'[\s\-_:,]+', title)
+        words = _TITLE_SPLIT_RE.split(title)
         keywords.extend([w for w in words if len(w) > 3])
     return list(set(keywords))
 
 
-def detect_side_quest(modified_files: List[str], ticket_keywords: List[str]) -> Tuple[bool, str]:
+def detect_side_quest(modified_files: List[str], ticket_keywords: List[str],
+                      files_lower: Optional[List[str]] = None,
+                      keyword_re: Optional["re.Pattern"] = None) -> Tuple[bool, str]:
     """
     Detect if work drifted from the main Linear ticket scope.
     
+    files_lower may carry the already-lowercased paths, index-aligned with
+    modified_files, and keyword_re a prebuilt _substring_re(ticket_keywords).
+    
     Returns: (is_side_quest, reason)
     """
     if not ticket_keywords:
         return False, "No tickets to compare against"
     
+    if files_lower is None:
+        files_lower = [f.lower() for f in modified_files]
+    if keyword_re is None:
+        keyword_re = _substring_re(ticket_keywords)
+    
+    # More than 30% unrelated files makes it a side quest; stop scanning once
+    # that is certain and the reason already has its three example files
+    unrelated_threshold = 0.3 * len(modified_files)
     unrelated_files = []
-    for file in modified_files:
-        file_lower = file.lower()
+    for file, file_lower in zip(modified_files, files_lower):
         # Check if any ticket keyword appears in the file path
-        if not any(kw in file_lower for kw in ticket_keywords):
+        if not keyword_re.search(file_lower):
             # Check if it's not a common config/meta file
-            if not any(meta in file_lower for meta in ['.gitignore', 'readme', 'license', '.env']):
+            if not _META_FILE_RE.search(file_lower):
                 unrelated_files.append(file)
+                if len(unrelated_files) > unrelated_threshold and len(unrelated_files) >= 3:
+                    break
     
-    # If more than 30% of files are unrelated, it's a side quest
-    if len(unrelated_files) > 0 and len(unrelated_files) / len(modified_files) > 0.3:
+    if unrelated_files and len(unrelated_files) > unrelated_threshold:
         return True, f"Files unrelated to ticket: {', '.join(unrelated_files[:3])}"
     
     return False, "Work aligned with ticket scope"
 
 
-def detect_skill_creation(modified_files: List[str]) -> Tuple[bool, str]:
+def detect_skill_creation(modified_files: List[str],
+                          files_lower: Optional[List[str]] = None) -> Tuple[bool, str]:
     """Detect if a new skill was created."""
-    skill_files = [f for f in modified_files if "skill" in f.lower() and f.endswith(".md")]
-    script_files = [f for f in modified_files if "/scripts/" in f.lower() and f.endswith(".py")]
+    if files_lower is None:
+        files_lower = [f.lower() for f in modified_files]
+    
+    pairs = list(zip(modified_files, files_lower))
+    skill_files = [f for f, low in pairs if "skill" in low and f.endswith(".md")]
+    script_files = [f for f, low in pairs if "/scripts/" in low and f.endswith(".py")]
     
     if skill_files and script_files:
         return True, f"New skill detected: {skill_files[0]}"
     return False, ""
 
 
-def detect_homework(modified_files: List[str], commit_messages: str) -> Tuple[bool, str]:
+def detect_homework(modified_files: List[str], commit_messages: str,
+                    files_lower: Optional[List[str]] = None) -> Tuple[bool, str]:
     """Detect if homework was completed."""
+    if files_lower is None:
+        files_lower = [f.lower() for f in modified_files]
+    
     # Check file paths
-    for file in modified_files:
-        if any(hw in file.lower() for hw in HOMEWORK_INDICATORS):
+    for file, file_lower in zip(modified_files, files_lower):
+        if _HOMEWORK_RE.search(file_lower):
             return True, f"Homework file modified: {file}"
     
     # Check commit messages
-    if any(hw in commit_messages.lower() for hw in HOMEWORK_INDICATORS):
+    if _HOMEWORK_RE.search(commit_messages.lower()):
         return True, "Homework mentioned in commit"
     
     return False, ""
 
 
-def detect_de_zoomcamp_content(modified_files: List[str], commit_messages: str) -> bool:
+def detect_de_zoomcamp_content(modified_files: List[str], commit_messages: str,
+                               files_lower: Optional[List[str]] = None) -> bool:
     """Check if content is related to DE Zoomcamp."""
-    all_text = " ".join(modified_files).lower() + " " + commit_messages.lower()
-    return any(indicator in all_text for indicator in DE_ZOOMCAMP_INDICATORS)
+    if files_lower is None:
+        files_lower = [f.lower() for f in modified_files]
+    all_text = " ".join(files_lower) + " " + commit_messages.lower()
+    return bool(_DE_ZOOMCAMP_RE.search(all_text))
 
 
 def analyze_session(context: Dict[str, Any]) -> PublishDecision:
@@ -158,20 +201,23 @@ def analyze_session(context: Dict[str, Any]) -> PublishDecision:
     
     modified_files = extract_modified_files(diff_stat)
     file_count = len(modified_files)
+    # Lowercased once here and shared by every detector below
+    files_lower = [f.lower() for f in modified_files]
     ticket_keywords = extract_ticket_keywords(tickets)
+    keyword_re = _substring_re(ticket_keywords) if ticket_keywords else None
     
     # Rule 0: Forced publish
     if force_publish and force_target:
         return PublishDecision(
             should_publish=True,
             content_type=ContentType.MANUAL,
-            target_repo=TargetRepo(force_target) if force_target in [r.value for r in TargetRepo] else TargetRepo.LEARNING_LOGS,
+            target_repo=_TARGET_REPO_BY_VALUE.get(force_target, TargetRepo.LEARNING_LOGS),
             reason="Manually flagged for publish",
             confidence=1.0
         )
     
     # Rule 1: New skill created → personal-ai-os
-    is_skill, skill_reason = detect_skill_creation(modified_files)
+    is_skill, skill_reason = detect_skill_creation(modified_files, files_lower)
     if is_skill:
         return PublishDecision(
             should_publish=True,
@@ -182,7 +228,7 @@ def analyze_session(context: Dict[str, Any]) -> PublishDecision:
         )
     
     # Rule 2: Homework completed → de-zoomcamp-2026
-    is_homework, homework_reason = detect_homework(modified_files, commit_log)
+    is_homework, homework_reason = detect_homework(modified_files, commit_log, files_lower)
     if is_homework:
         return PublishDecision(
             should_publish=True,
@@ -193,7 +239,7 @@ def analyze_session(context: Dict[str, Any]) -> PublishDecision:
         )
     
     # Rule 3: Side Quest detected → learning-logs
-    is_side_quest, sq_reason = detect_side_quest(modified_files, ticket_keywords)
+    is_side_quest, sq_reason = detect_side_quest(modified_files, ticket_keywords, files_lower, keyword_re)
     if is_side_quest:
         return PublishDecision(
             should_publish=True,
@@ -206,7 +252,7 @@ def analyze_session(context: Dict[str, Any]) -> PublishDecision:
     # Rule 4: Significant code changes (≥3 files) → learning-logs
     if file_count >= 3:
         # Determine if it's DE Zoomcamp related
-        is_de = detect_de_zoomcamp_content(modified_files, commit_log)
+        is_de = detect_de_zoomcamp_content(modified_files, commit_log, files_lower)
         return PublishDecision(
             should_publish=True,
             content_type=ContentType.LEARNING_LOG,
@@ -225,6 +271,11 @@ def analyze_session(context: Dict[str, Any]) -> PublishDecision:
     )
 
 
+def _enum_value(member: Optional[Enum], default: Optional[str] = None) -> Optional[str]:
+    """Value of an optional enum member, or default when it is None."""
+    return member.value if member is not None else default
+
+
 def format_decision(decision: PublishDecision) -> str:
     """Format the decision for display."""
     if decision.should_publish:
@@ -232,8 +283,8 @@ def format_decision(decision: PublishDecision) -> str:
 📢 PUBLISH RECOMMENDATION
 ========================
 ✅ Should Publish: Yes
-📁 Target Repo: {decision.target_repo.value if decision.target_repo else 'N/A'}
-📝 Content Type: {decision.content_type.value if decision.content_type else 'N/A'}
+📁 Target Repo: {_enum_value(decision.target_repo, 'N/A')}
+📝 Content Type: {_enum_value(decision.content_type, 'N/A')}
 💡 Reason: {decision.reason}
 🎯 Confidence: {decision.confidence:.0%}
 """
@@ -285,8 +336,8 @@ if __name__ == "__main__":
             print("\n--- JSON Output ---")
             print(json.dumps({
                 "should_publish": decision.should_publish,
-                "content_type": decision.content_type.value if decision.content_type else None,
-                "target_repo": decision.target_repo.value if decision.target_repo else None,
+                "content_type": _enum_value(decision.content_type),
+                "target_repo": _enum_value(decision.target_repo),
                 "reason": decision.reason,
                 "confidence": decision.confidence
             }, indent=2))
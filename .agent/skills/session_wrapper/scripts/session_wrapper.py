@@ -12,7 +12,7 @@ from datetime import datetime
 from pathlib import Path
 
 # Import sibling modules
-from collect_context import get_config, get_git_info, get_linear_tickets, get_obsidian_focus
+from collect_context import gather_context, get_config
 from publish_detector import analyze_session, format_decision, PublishDecision
 from linear_client import LinearClient, format_issues_for_display
 
@@ -20,12 +20,14 @@ from linear_client import LinearClient, format_issues_for_display
 def collect_full_context() -> dict:
     """Collect all context data for the session."""
     config = get_config()
+    now = datetime.now()
+    git_data, linear_data, obsidian_data = gather_context(config, now)
     
     context = {
-        "timestamp": datetime.now().isoformat(),
-        "git": get_git_info(),
-        "linear": get_linear_tickets(config),
-        "obsidian": get_obsidian_focus(config),
+        "timestamp": now.isoformat(),
+        "git": git_data,
+        "linear": linear_data,
+        "obsidian": obsidian_data,
         "config": {
             "vault_path": config.get("obsidian", {}).get("vault_path"),
             "linear_workspace": config.get("linear", {}).get("workspace")